@@ -0,0 +1,355 @@
+# Subcomando 'bench' - se carga bajo demanda desde m8bits.psm1
+
+Import-M8bitsLibrary -Name templates
+Import-M8bitsLibrary -Name metrics
+
+function script:Invoke-M8bitsBench {
+    <#
+    .SYNOPSIS
+    Mide el despliegue de plantillas, los hooks y el arranque del modulo.
+
+    .DESCRIPTION
+    init: crea un arbol de plantilla sintetico y mide cada fase de la
+    sincronizacion (manifest, manifest-cached, copy, resync) frente a un
+    Copy-Item ciego.
+    hooks: reproduce eventos sinteticos a traves de los hooks reales
+    configurados en .claude/settings.local.json, en una copia temporal de
+    .claude para no ensuciar el historial del proyecto.
+    startup: ejecuta tools/Measure-M8bitsStartup.ps1.
+
+    Las muestras de init y hooks se guardan en el archivo de metricas del
+    proyecto (ver 'm8bits stats') y se muestra su p50/p99.
+
+    .PARAMETER Action
+    Que medir: init, hooks o startup.
+
+    .PARAMETER Path
+    Proyecto donde se guardan las metricas y cuyos hooks se miden. Si no
+    tiene .claude, las metricas van a la cache del usuario.
+
+    .PARAMETER Iterations
+    Repeticiones de cada medicion.
+
+    .PARAMETER Files
+    (init) Numero de archivos del arbol sintetico.
+
+    .PARAMETER FileSizeKB
+    (init) Tamano de cada archivo sintetico.
+
+    .EXAMPLE
+    m8bits bench init -Files 2000 -FileSizeKB 8
+    #>
+    [CmdletBinding()]
+    param(
+        [ValidateSet("init", "hooks", "startup")]
+        [string]$Action = "init",
+
+        [string]$Path = (Get-Location),
+
+        [ValidateRange(1, 1000)]
+        [int]$Iterations,
+
+        [ValidateRange(1, 1000000)]
+        [int]$Files = 500,
+
+        [ValidateRange(0, 102400)]
+        [int]$FileSizeKB = 4
+    )
+
+    switch ($Action) {
+        "init" {
+            if (-not $Iterations) { $Iterations = 3 }
+            Write-Host "Midiendo sincronizacion: $Files archivos de $FileSizeKB KB, $Iterations iteraciones..." -ForegroundColor Cyan
+            $samples = @(Measure-ClaudeTemplateSync -Files $Files -FileSizeKB $FileSizeKB -Iterations $Iterations)
+        }
+        "hooks" {
+            if (-not $Iterations) { $Iterations = 20 }
+            $samples = @(Measure-ClaudeHook -Path $Path -Iterations $Iterations)
+        }
+        "startup" {
+            $parameters = @{}
+            if ($Iterations) {
+                $parameters.Iterations = $Iterations
+            }
+            & (Join-Path $script:ModuleRoot "tools" "Measure-M8bitsStartup.ps1") @parameters
+            return
+        }
+    }
+
+    if (-not $samples) {
+        return
+    }
+
+    Measure-M8bitsMetric -Samples $samples | Format-Table -AutoSize | Out-Host
+    try {
+        Add-M8bitsMetric -Path $Path -Samples $samples
+        Write-Host "[OK] $($samples.Count) muestras guardadas en $(Get-M8bitsMetricsPath -Path $Path)" -ForegroundColor Green
+    }
+    catch {
+        Write-Host "[!] No se pudieron guardar las metricas: $_" -ForegroundColor Yellow
+    }
+}
+
+function script:New-SyntheticTemplateTree {
+    # Arbol con la forma de templates/: .claude/<carpeta>/<archivo>, 20 archivos por carpeta
+    param(
+        [Parameter(Mandatory)]
+        [string]$Path,
+
+        [int]$Files,
+
+        [int]$FileSizeKB
+    )
+
+    $random = [System.Random]::new(8)
+    $buffer = [byte[]]::new($FileSizeKB * 1KB)
+    for ($i = 0; $i -lt $Files; $i++) {
+        $folder = Join-Path $Path ".claude" ("dir-{0:D3}" -f [math]::Floor($i / 20))
+        if (-not (Test-Path -LiteralPath $folder)) {
+            New-Item -ItemType Directory -Path $folder -Force | Out-Null
+        }
+        $random.NextBytes($buffer)
+        [System.IO.File]::WriteAllBytes((Join-Path $folder ("file-{0:D6}.txt" -f $i)), $buffer)
+    }
+}
+
+function script:Measure-ClaudeTemplateSync {
+    <#
+    .SYNOPSIS
+    Mide las fases de la sincronizacion sobre un arbol sintetico.
+
+    .DESCRIPTION
+    Fases: manifest (Get-TemplateFolderManifest sin cache: recorrer y
+    hashear), manifest-cached (la misma llamada revalidando la cache),
+    copy (primer despliegue con Sync-ClaudeTemplate), resync (segunda
+    sincronizacion sin cambios) y copy-item (copia ciega, como referencia).
+    Todo ocurre en una carpeta temporal que se borra al terminar.
+    #>
+    param(
+        [int]$Files,
+
+        [int]$FileSizeKB,
+
+        [int]$Iterations
+    )
+
+    $workspace = Join-Path ([System.IO.Path]::GetTempPath()) "m8bits-bench-$([System.IO.Path]::GetRandomFileName())"
+    $source = Join-Path $workspace "templates"
+    try {
+        New-SyntheticTemplateTree -Path $source -Files $Files -FileSizeKB $FileSizeKB
+        $watch = [System.Diagnostics.Stopwatch]::new()
+
+        for ($i = 1; $i -le $Iterations; $i++) {
+            $target = Join-Path $workspace "project-$i"
+            New-Item -ItemType Directory -Path $target -Force | Out-Null
+
+            # Manifiesto con la misma funcion que usa init, sin cache y con ella ya creada
+            $cacheFile = Join-Path $workspace "manifest-cache.json"
+            Remove-Item -LiteralPath $cacheFile -Force -ErrorAction SilentlyContinue
+
+            $watch.Restart()
+            $manifest = Get-TemplateFolderManifest -SourcePath $source -CacheFile $cacheFile
+            [PSCustomObject]@{ Suite = "init"; Name = "manifest"; Ms = $watch.Elapsed.TotalMilliseconds }
+
+            $watch.Restart()
+            $manifest = Get-TemplateFolderManifest -SourcePath $source -CacheFile $cacheFile
+            [PSCustomObject]@{ Suite = "init"; Name = "manifest-cached"; Ms = $watch.Elapsed.TotalMilliseconds }
+
+            $watch.Restart()
+            Sync-ClaudeTemplate -TargetPath $target -Manifest $manifest -SourcePath $source | Out-Null
+            [PSCustomObject]@{ Suite = "init"; Name = "copy"; Ms = $watch.Elapsed.TotalMilliseconds }
+
+            $watch.Restart()
+            Sync-ClaudeTemplate -TargetPath $target -Manifest $manifest -SourcePath $source | Out-Null
+            [PSCustomObject]@{ Suite = "init"; Name = "resync"; Ms = $watch.Elapsed.TotalMilliseconds }
+
+            $watch.Restart()
+            Copy-Item -LiteralPath $source -Destination (Join-Path $workspace "blind-$i") -Recurse -Force
+            [PSCustomObject]@{ Suite = "init"; Name = "copy-item"; Ms = $watch.Elapsed.TotalMilliseconds }
+        }
+    }
+    finally {
+        if (Test-Path -LiteralPath $workspace) {
+            Remove-Item -LiteralPath $workspace -Recurse -Force
+        }
+    }
+}
+
+function script:Measure-ClaudeHook {
+    <#
+    .SYNOPSIS
+    Reproduce eventos sinteticos a traves de los hooks configurados y mide cada uno.
+
+    .DESCRIPTION
+    Lee los hooks de tipo "command" de .claude/settings.local.json y ejecuta
+    cada uno -Iterations veces con un payload JSON por stdin, como lo hace
+    Claude Code. Se ejecutan sobre una copia temporal de .claude (sin logs
+    ni data) con CLAUDE_PROJECT_DIR apuntando a ella.
+    #>
+    param(
+        [Parameter(Mandatory)]
+        [string]$Path,
+
+        [int]$Iterations
+    )
+
+    # Las llamadas .NET (GetRelativePath) resuelven contra el directorio del
+    # proceso, no contra Get-Location: se trabaja siempre con la ruta absoluta
+    $Path = $ExecutionContext.SessionState.Path.GetUnresolvedProviderPathFromPSPath($Path)
+    $claudeFolder = Join-Path $Path ".claude"
+    $settingsPath = Join-Path $claudeFolder "settings.local.json"
+    if (-not (Test-Path -LiteralPath $settingsPath)) {
+        Write-Host "[X] No se encontro $settingsPath" -ForegroundColor Red
+        return
+    }
+
+    $settings = Get-Content -LiteralPath $settingsPath -Raw | ConvertFrom-Json -AsHashtable
+    $hooks = @()
+    if ($settings -and $settings.hooks) {
+        $hooks = foreach ($hookEvent in $settings.hooks.Keys) {
+            foreach ($group in @($settings.hooks[$hookEvent])) {
+                foreach ($hook in @($group.hooks)) {
+                    if ($hook -and $hook.type -eq "command" -and $hook.command) {
+                        # Como Claude Code: timeout en segundos, 60 por defecto
+                        $timeout = if ($hook.timeout -gt 0) { [int]$hook.timeout } else { 60 }
+                        @{ Event = $hookEvent; Command = $hook.command; Timeout = $timeout }
+                    }
+                }
+            }
+        }
+    }
+    if (-not $hooks) {
+        Write-Host "[!] No hay hooks de tipo command en $settingsPath" -ForegroundColor Yellow
+        return
+    }
+
+    $workspace = Join-Path ([System.IO.Path]::GetTempPath()) "m8bits-hooks-$([System.IO.Path]::GetRandomFileName())"
+    try {
+        # Copia de .claude sin el historial ni los datos del proyecto
+        foreach ($item in Get-ChildItem -LiteralPath $claudeFolder -Recurse -File -Force) {
+            $relative = [System.IO.Path]::GetRelativePath($claudeFolder, $item.FullName) -replace '\\', '/'
+            if ($relative -like "logs_system/logs/*" -or $relative -like "logs_system/data/*") {
+                continue
+            }
+            $destination = Join-Path $workspace ".claude" $relative
+            $parent = Split-Path $destination -Parent
+            if (-not (Test-Path -LiteralPath $parent)) {
+                New-Item -ItemType Directory -Path $parent -Force | Out-Null
+            }
+            Copy-Item -LiteralPath $item.FullName -Destination $destination
+        }
+        foreach ($folder in "logs", "data") {
+            New-Item -ItemType Directory -Path (Join-Path $workspace ".claude" "logs_system" $folder) -Force | Out-Null
+        }
+
+        $sessionId = "m8bits-bench-$([guid]::NewGuid())"
+        $transcriptPath = Join-Path $workspace ".claude" "m8bits-bench-transcript.jsonl"
+        $transcript = for ($i = 0; $i -lt 20; $i++) {
+            $role = if ($i % 2) { "assistant" } else { "user" }
+            @{ type = $role; sessionId = $sessionId; message = @{ role = $role; content = "Mensaje sintetico $i" } } | ConvertTo-Json -Compress -Depth 4
+        }
+        Set-Content -LiteralPath $transcriptPath -Value $transcript -Encoding utf8
+
+        foreach ($hook in $hooks) {
+            $name = "$($hook.Event): $($hook.Command)"
+            Write-Host "Midiendo $name ($Iterations eventos)..." -ForegroundColor Cyan
+            for ($i = 1; $i -le $Iterations; $i++) {
+                $payload = @{
+                    session_id = $sessionId
+                    transcript_path = $transcriptPath
+                    cwd = $workspace
+                    hook_event_name = $hook.Event
+                    prompt = "Prompt sintetico $i de m8bits bench"
+                    stop_hook_active = $false
+                    tool_name = "Bash"
+                    tool_input = @{ command = "echo m8bits" }
+                } | ConvertTo-Json -Compress -Depth 4
+
+                $run = Invoke-HookCommand -Command $hook.Command -Payload $payload -WorkingDirectory $workspace -TimeoutSeconds $hook.Timeout
+                [PSCustomObject]@{ Suite = "hooks"; Name = $name; Ms = $run.Ms; Error = $run.TimedOut -or $run.ExitCode -ne 0 }
+            }
+        }
+    }
+    finally {
+        if (Test-Path -LiteralPath $workspace) {
+            Remove-Item -LiteralPath $workspace -Recurse -Force
+        }
+    }
+}
+
+function script:Invoke-HookCommand {
+    # Ejecuta un hook en la shell del sistema con el payload por stdin y mide su duracion.
+    # Si supera -TimeoutSeconds se mata su arbol de procesos y se marca TimedOut.
+    param(
+        [Parameter(Mandatory)]
+        [string]$Command,
+
+        [Parameter(Mandatory)]
+        [string]$Payload,
+
+        [Parameter(Mandatory)]
+        [string]$WorkingDirectory,
+
+        [int]$TimeoutSeconds = 60
+    )
+
+    $startInfo = [System.Diagnostics.ProcessStartInfo]::new()
+    if ($IsWindows) {
+        $startInfo.FileName = "cmd.exe"
+        $startInfo.Arguments = "/d /s /c `"$Command`""
+    }
+    else {
+        $startInfo.FileName = "/bin/sh"
+        $startInfo.ArgumentList.Add("-c")
+        $startInfo.ArgumentList.Add($Command)
+    }
+    $startInfo.WorkingDirectory = $WorkingDirectory
+    $startInfo.UseShellExecute = $false
+    $startInfo.RedirectStandardInput = $true
+    $startInfo.RedirectStandardOutput = $true
+    $startInfo.RedirectStandardError = $true
+    $startInfo.Environment["CLAUDE_PROJECT_DIR"] = $WorkingDirectory
+
+    $watch = [System.Diagnostics.Stopwatch]::StartNew()
+    $process = $null
+    try {
+        $process = [System.Diagnostics.Process]::Start($startInfo)
+
+        # Se leen las salidas en paralelo para que el hook no se bloquee si escribe mucho
+        $stdout = $process.StandardOutput.ReadToEndAsync()
+        $stderr = $process.StandardError.ReadToEndAsync()
+        try {
+            $process.StandardInput.Write($Payload)
+            $process.StandardInput.Close()
+        }
+        catch [System.IO.IOException] {
+            # El hook termino sin leer stdin
+            Write-Verbose "Hook '$Command' no leyo el payload: $_"
+        }
+
+        if (-not $process.WaitForExit($TimeoutSeconds * 1000)) {
+            $process.Kill($true)
+            $process.WaitForExit()
+            $watch.Stop()
+            Write-Verbose "Hook '$Command' supero el timeout de $TimeoutSeconds s"
+            return [PSCustomObject]@{ Ms = $watch.Elapsed.TotalMilliseconds; ExitCode = $null; TimedOut = $true }
+        }
+        $process.WaitForExit()
+        $watch.Stop()
+        [void]$stdout.Result
+        if ($process.ExitCode -ne 0) {
+            Write-Verbose "Hook '$Command' termino con codigo $($process.ExitCode): $($stderr.Result)"
+        }
+        return [PSCustomObject]@{ Ms = $watch.Elapsed.TotalMilliseconds; ExitCode = $process.ExitCode; TimedOut = $false }
+    }
+    catch {
+        $watch.Stop()
+        Write-Verbose "No se pudo ejecutar el hook '$Command': $_"
+        return [PSCustomObject]@{ Ms = $watch.Elapsed.TotalMilliseconds; ExitCode = $null; TimedOut = $false }
+    }
+    finally {
+        if ($process) {
+            $process.Dispose()
+        }
+    }
+}
@@ -0,0 +1,183 @@
+# Subcomando 'bulk' - se carga bajo demanda desde m8bits.psm1
+
+Import-M8bitsLibrary -Name templates
+Import-M8bitsLibrary -Name projects
+
+function script:Initialize-ClaudeProjectBatch {
+    <#
+    .SYNOPSIS
+    Inicializa o sincroniza .claude en muchos proyectos a la vez.
+
+    .DESCRIPTION
+    Reune los proyectos indicados por -Path (rutas o comodines) y/o los
+    repositorios git encontrados bajo -Root, y los sincroniza en paralelo
+    con ForEach-Object -Parallel. No es interactivo: -Conflict decide que
+    hacer con los archivos editados localmente.
+
+    .PARAMETER Path
+    Rutas de proyectos; admite comodines (ej: C:\_dev\api-*).
+
+    .PARAMETER Root
+    Carpeta donde buscar repositorios git (carpetas que contienen .git).
+
+    .PARAMETER Depth
+    Profundidad maxima de busqueda bajo -Root.
+
+    .PARAMETER Conflict
+    Keep: conserva los archivos modificados localmente (por defecto).
+    Overwrite: los reemplaza por la plantilla.
+    Skip: no toca los proyectos que ya tienen .claude.
+
+    .PARAMETER ThrottleLimit
+    Numero maximo de proyectos procesados en paralelo.
+
+    .PARAMETER LinkMode
+    Copy (por defecto), HardLink o SymbolicLink para los recursos inmutables.
+
+    .PARAMETER PassThru
+    Devuelve los resultados por proyecto ademas de mostrar la tabla.
+
+    .EXAMPLE
+    Initialize-ClaudeProjectBatch -Root C:\_dev -Conflict Keep -ThrottleLimit 16
+    #>
+    [CmdletBinding()]
+    param(
+        [Parameter(ValueFromPipeline)]
+        [string[]]$Path,
+
+        [string]$Root,
+
+        [int]$Depth = 3,
+
+        [ValidateSet("Keep", "Overwrite", "Skip")]
+        [string]$Conflict = "Keep",
+
+        [ValidateRange(1, 64)]
+        [int]$ThrottleLimit = 8,
+
+        [ValidateSet("Copy", "HardLink", "SymbolicLink")]
+        [string]$LinkMode = "Copy",
+
+        [switch]$PassThru
+    )
+
+    begin {
+        $paths = [System.Collections.Generic.List[string]]::new()
+    }
+
+    process {
+        foreach ($item in $Path) {
+            $paths.Add($item)
+        }
+    }
+
+    end {
+        try {
+            $targets = Find-ClaudeProject -Path $paths -Root $Root -Depth $Depth
+        }
+        catch {
+            Write-Host "[X] $_" -ForegroundColor Red
+            return
+        }
+
+        if (-not $targets) {
+            Write-Host "[!] No se encontraron proyectos. Usa -Path o -Root." -ForegroundColor Yellow
+            return
+        }
+
+        if (-not (Test-TemplateSource)) {
+            Write-Host "[X] No se encontro la carpeta fuente: $script:ClaudeCleanPath" -ForegroundColor Red
+            return
+        }
+
+        Write-Host "Sincronizando $($targets.Count) proyectos ($ThrottleLimit en paralelo)..." -ForegroundColor Cyan
+        $watch = [System.Diagnostics.Stopwatch]::StartNew()
+
+        # El manifiesto y el origen se calculan una sola vez y se comparten con los runspaces
+        $manifest = Get-TemplateManifest
+        $sourcePath = if ($script:TemplateManifest.Bundle -or $LinkMode -ne "Copy") { Get-TemplateStore -Manifest $manifest } else { $script:ClaudeCleanPath }
+        $modulePath = Join-Path $script:ModuleRoot "m8bits.psd1"
+
+        $results = $targets | ForEach-Object -ThrottleLimit $ThrottleLimit -Parallel {
+            $target = $_
+            $conflict = $using:Conflict
+            $projectWatch = [System.Diagnostics.Stopwatch]::StartNew()
+            $row = [ordered]@{
+                Project = $target
+                Status = "OK"
+                Added = 0
+                Changed = 0
+                Unchanged = 0
+                Modified = 0
+                Overwritten = 0
+                Linked = 0
+                Seconds = 0
+                Error = $null
+            }
+
+            try {
+                if ($conflict -eq "Skip" -and (Test-Path -LiteralPath (Join-Path $target ".claude"))) {
+                    $row.Status = "Skipped"
+                }
+                else {
+                    # Los runspaces reutilizados conservan el modulo ya importado
+                    $module = Get-Module m8bits
+                    if (-not $module) {
+                        $module = Import-Module $using:modulePath -PassThru
+                    }
+                    $result = & $module {
+                        param($TargetPath, $Overwrite, $Manifest, $SourcePath, $LinkMode)
+                        Import-M8bitsLibrary -Name templates
+                        Sync-ClaudeTemplate -TargetPath $TargetPath -Force:$Overwrite -Manifest $Manifest -SourcePath $SourcePath -LinkMode $LinkMode
+                    } $target ($conflict -eq "Overwrite") $using:manifest $using:sourcePath $using:LinkMode
+
+                    foreach ($status in "Added", "Changed", "Unchanged", "Modified", "Overwritten", "Linked") {
+                        $row[$status] = $result.$status.Count
+                    }
+                    if ($result.Modified.Count) {
+                        $row.Status = "Conflicts"
+                    }
+                }
+            }
+            catch {
+                $row.Status = "Error"
+                $row.Error = "$_"
+            }
+
+            $row.Seconds = [math]::Round($projectWatch.Elapsed.TotalSeconds, 2)
+            [PSCustomObject]$row
+        }
+
+        $watch.Stop()
+        Write-M8bitsBatchReport -Results $results -Elapsed $watch.Elapsed
+
+        if ($PassThru) {
+            return $results
+        }
+    }
+}
+
+function script:Write-M8bitsBatchReport {
+    param(
+        [Parameter(Mandatory)]
+        [object[]]$Results,
+
+        [Parameter(Mandatory)]
+        [TimeSpan]$Elapsed
+    )
+
+    $Results | Sort-Object Project |
+        Format-Table Project, Status, Added, Changed, Unchanged, Modified, Overwritten, Linked, Seconds -AutoSize |
+        Out-Host
+
+    $errors = @($Results | Where-Object Status -eq "Error")
+    foreach ($row in $errors) {
+        Write-Host "  [X] $($row.Project): $($row.Error)" -ForegroundColor Red
+    }
+
+    $conflicts = @($Results | Where-Object Status -eq "Conflicts").Count
+    $projectSeconds = ($Results | Measure-Object Seconds -Sum).Sum
+    $color = if ($errors.Count) { "Red" } elseif ($conflicts) { "Yellow" } else { "Green" }
+    Write-Host ("[OK] {0} proyectos en {1:N2} s (suma por proyecto: {2:N2} s). Errores: {3}  Con conflictos: {4}" -f
+        $Results.Count, $Elapsed.TotalSeconds, $projectSeconds, $errors.Count, $conflicts) -ForegroundColor $color
+}
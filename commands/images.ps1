@@ -0,0 +1,97 @@
+# Subcomando 'images' - se carga bajo demanda desde m8bits.psm1
+
+function script:Optimize-ClaudeImageStore {
+    <#
+    .SYNOPSIS
+    Deduplica las imagenes guardadas en .claude/logs_system/data.
+
+    .DESCRIPTION
+    Agrupa las imagenes por tamano y, dentro de cada grupo, por hash SHA256
+    del contenido. Las copias repetidas se reemplazan por enlaces duros al
+    primer archivo del grupo, de modo que todas las rutas siguen siendo
+    validas pero el contenido ocupa espacio una sola vez. Muestra cuanto
+    espacio se recupera; con -WhatIf solo lo calcula.
+
+    .PARAMETER Path
+    Directorio del proyecto (por defecto, el directorio actual).
+
+    .PARAMETER Include
+    Extensiones de imagen a considerar.
+
+    .EXAMPLE
+    m8bits images -WhatIf
+    Muestra cuanto espacio se recuperaria sin tocar archivos.
+    #>
+    [CmdletBinding(SupportsShouldProcess)]
+    param(
+        [string]$Path = (Get-Location),
+
+        [string[]]$Include = @("*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp")
+    )
+
+    $dataPath = Join-Path $Path ".claude" "logs_system" "data"
+    if (-not (Test-Path -LiteralPath $dataPath)) {
+        Write-Host "[!] No se encontro la carpeta de datos: $dataPath" -ForegroundColor Yellow
+        return
+    }
+
+    $images = Get-ChildItem -LiteralPath $dataPath -Recurse -File -Force -Include $Include
+
+    # Solo se hashean los archivos que comparten tamano con algun otro
+    $candidates = $images | Group-Object Length | Where-Object { $_.Count -gt 1 -and $_.Name -ne "0" }
+
+    $duplicates = 0
+    $reclaimed = 0L
+    $failed = 0
+    foreach ($sizeGroup in $candidates) {
+        $byHash = $sizeGroup.Group | Group-Object { (Get-FileHash -LiteralPath $_.FullName -Algorithm SHA256).Hash }
+        foreach ($hashGroup in $byHash | Where-Object Count -gt 1) {
+            # Si alguno ya es enlace duro se usa como original; los demas enlaces se dejan como estan
+            $files = @($hashGroup.Group | Sort-Object { $_.LinkType -ne "HardLink" }, LastWriteTimeUtc)
+            $keeper = $files[0]
+
+            foreach ($duplicate in $files | Select-Object -Skip 1) {
+                if ($duplicate.LinkType -eq "HardLink") {
+                    continue
+                }
+                if (-not $PSCmdlet.ShouldProcess($duplicate.FullName, "Reemplazar por enlace a $($keeper.Name)")) {
+                    # Con -WhatIf se informa lo que se recuperaria; un "No" en -Confirm no cuenta
+                    if ($WhatIfPreference) {
+                        $duplicates++
+                        $reclaimed += $duplicate.Length
+                    }
+                    continue
+                }
+
+                # Se crea el enlace con otro nombre y luego se reemplaza, para no perder el archivo si falla
+                $staging = "$($duplicate.FullName).m8bits-tmp"
+                try {
+                    New-Item -ItemType HardLink -Path $staging -Target $keeper.FullName -ErrorAction Stop | Out-Null
+                    Remove-Item -LiteralPath $duplicate.FullName -Force
+                    Move-Item -LiteralPath $staging -Destination $duplicate.FullName
+                    $duplicates++
+                    $reclaimed += $duplicate.Length
+                }
+                catch {
+                    $failed++
+                    Write-Verbose "No se pudo enlazar $($duplicate.FullName): $_"
+                    if (Test-Path -LiteralPath $staging) {
+                        if (Test-Path -LiteralPath $duplicate.FullName) {
+                            Remove-Item -LiteralPath $staging -Force
+                        }
+                        else {
+                            Move-Item -LiteralPath $staging -Destination $duplicate.FullName
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+    $verb = if ($WhatIfPreference) { "se recuperarian" } else { "recuperados" }
+    Write-Host ("[OK] {0} imagenes revisadas, {1} duplicadas: {2:N1} MB {3}." -f
+        @($images).Count, $duplicates, ($reclaimed / 1MB), $verb) -ForegroundColor Green
+    if ($failed) {
+        Write-Host "[!] $failed archivos no se pudieron enlazar (usa -Verbose para ver el motivo)." -ForegroundColor Yellow
+    }
+}
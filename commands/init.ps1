@@ -0,0 +1,60 @@
+# Subcomando 'init' - se carga bajo demanda desde m8bits.psm1
+
+Import-M8bitsLibrary -Name templates
+
+function script:Initialize-ClaudeProject {
+    <#
+    .SYNOPSIS
+    Inicializa la configuracion de Claude Code en el directorio actual.
+
+    .DESCRIPTION
+    Solo copia los archivos de la plantilla que no existen o cuyo contenido
+    difiere, de modo que los archivos sin cambios conservan su fecha. Si ya
+    existe .claude, los archivos editados localmente se conservan y se
+    listan; -Force los reemplaza por la plantilla.
+
+    .PARAMETER Path
+    Directorio del proyecto (por defecto, el directorio actual).
+
+    .PARAMETER Force
+    Sobrescribe tambien los archivos modificados localmente.
+
+    .PARAMETER LinkMode
+    HardLink o SymbolicLink enlazan hooks, chat_viewer y docs desde el
+    almacen compartido del modulo en lugar de copiarlos.
+    #>
+    [CmdletBinding()]
+    param(
+        [string]$Path = (Get-Location),
+
+        [switch]$Force,
+
+        [ValidateSet("Copy", "HardLink", "SymbolicLink")]
+        [string]$LinkMode = "Copy"
+    )
+
+    $targetPath = $Path
+    $claudeFolder = Join-Path $targetPath ".claude"
+
+    # Con .claude existente se sincroniza sin preguntar: las ediciones locales
+    # se conservan (Write-TemplateSyncReport las lista) salvo con -Force
+    if ((Test-Path $claudeFolder) -and -not $Force) {
+        Write-Host "[!] Ya existe una carpeta .claude: se actualiza conservando los archivos editados localmente." -ForegroundColor Yellow
+    }
+
+    # Verificar que existe la fuente
+    if (-not (Test-TemplateSource)) {
+        Write-Host "[X] No se encontro la carpeta fuente: $script:ClaudeCleanPath" -ForegroundColor Red
+        return
+    }
+
+    # Copiar configuracion
+    try {
+        $result = Sync-ClaudeTemplate -TargetPath $targetPath -Force:$Force -LinkMode $LinkMode
+        Write-TemplateSyncReport -Result $result
+        Write-Host "     Ahora puedes ejecutar 'claude' para iniciar Claude Code." -ForegroundColor Cyan
+    }
+    catch {
+        Write-Host "[X] Error al copiar: $_" -ForegroundColor Red
+    }
+}
@@ -0,0 +1,652 @@
+# Subcomando 'logs' - se carga bajo demanda desde m8bits.psm1
+
+Import-M8bitsLibrary -Name projects
+
+# Archivos de historial que se consideran texto buscable
+$script:LogTextPatterns = @("*.jsonl", "*.json", "*.log", "*.md", "*.txt")
+
+# Extension de los segmentos comprimidos por 'logs compact'
+$script:LogArchiveExtension = ".gz"
+
+# Indice de busqueda por proyecto (en logs_system/data) y longitud maxima de
+# las palabras indexadas: las mas largas suelen ser blobs base64 (imagenes)
+$script:LogIndexFileName = "m8bits-search-index.json"
+$script:LogIndexMaxToken = 64
+
+function script:Invoke-ClaudeLogs {
+    <#
+    .SYNOPSIS
+    Operaciones sobre el historial de .claude/logs_system.
+
+    .PARAMETER Action
+    Accion a ejecutar: search o compact.
+
+    .PARAMETER Query
+    (search) Texto a buscar.
+
+    .PARAMETER Path
+    Proyecto(s). search usa el primero; compact acepta varios y comodines.
+    Por defecto, el directorio actual.
+
+    .PARAMETER IncludeArchived
+    (search) Busca tambien en los segmentos comprimidos.
+
+    .PARAMETER Root
+    (compact) Carpeta donde buscar repositorios git.
+
+    .PARAMETER HotDays
+    (compact) Los archivos modificados en los ultimos N dias no se comprimen.
+
+    .PARAMETER RetentionDays
+    (compact) Borra los archivos comprimidos con mas de N dias (0 = nunca).
+
+    .PARAMETER MaxSizeMB
+    (compact) Tamano maximo de la carpeta de logs; borra los archivos
+    comprimidos mas antiguos hasta cumplirlo (0 = sin limite).
+
+    .PARAMETER ThrottleLimit
+    (compact) Numero maximo de proyectos procesados en paralelo.
+
+    .EXAMPLE
+    m8bits logs search "timeout" -First 20 -Skip 20
+    Segunda pagina de 20 resultados.
+
+    .EXAMPLE
+    m8bits logs compact -Root C:\_dev -RetentionDays 60 -MaxSizeMB 200
+    Comprime y aplica la retencion en todos los repositorios bajo C:\_dev.
+
+    .EXAMPLE
+    m8bits logs compact -MaxSizeMB 200 -WhatIf
+    Muestra que se comprimiria y borraria sin tocar ningun archivo.
+    #>
+    [CmdletBinding(SupportsShouldProcess)]
+    param(
+        [ValidateSet("search", "compact")]
+        [string]$Action = "search",
+
+        [string]$Query,
+
+        [string[]]$Path = @((Get-Location).Path),
+
+        [ValidateRange(1, [int]::MaxValue)]
+        [int]$First = 50,
+
+        [ValidateRange(0, [int]::MaxValue)]
+        [int]$Skip = 0,
+
+        [switch]$Regex,
+
+        [switch]$IncludeArchived,
+
+        [string]$Root,
+
+        [ValidateRange(1, 3650)]
+        [int]$HotDays = 7,
+
+        [ValidateRange(0, 36500)]
+        [int]$RetentionDays = 0,
+
+        [ValidateRange(0, [double]::MaxValue)]
+        [double]$MaxSizeMB = 0,
+
+        [ValidateRange(1, 64)]
+        [int]$ThrottleLimit = 8
+    )
+
+    switch ($Action) {
+        "search" {
+            if (-not $Query) {
+                Write-Host "[X] Indica el texto a buscar: m8bits logs search <texto>" -ForegroundColor Red
+                return
+            }
+            # El indice y las sesiones usan rutas relativas calculadas con .NET,
+            # que no conoce Get-Location: se pasa la ruta absoluta
+            $projectPath = $PSCmdlet.GetUnresolvedProviderPathFromPSPath($Path[0])
+            Search-ClaudeLog -Path $projectPath -Query $Query -First $First -Skip $Skip -Regex:$Regex -IncludeArchived:$IncludeArchived
+        }
+        "compact" {
+            $projectPaths = if ($Root -and -not $PSBoundParameters.ContainsKey("Path")) { @() } else { $Path }
+            try {
+                $targets = Find-ClaudeProject -Path $projectPaths -Root $Root
+            }
+            catch {
+                Write-Host "[X] $_" -ForegroundColor Red
+                return
+            }
+            if (-not $targets) {
+                Write-Host "[!] No se encontraron proyectos. Usa -Path o -Root." -ForegroundColor Yellow
+                return
+            }
+
+            $watch = [System.Diagnostics.Stopwatch]::StartNew()
+            # -Confirm necesita preguntar desde esta sesion, asi que no se paraleliza
+            if ($targets.Count -eq 1 -or $ConfirmPreference -eq "Low") {
+                $results = @(foreach ($target in $targets) {
+                    Compress-ClaudeLog -Path $target -HotDays $HotDays -RetentionDays $RetentionDays -MaxSizeMB $MaxSizeMB
+                })
+            }
+            else {
+                Write-Host "Compactando logs de $($targets.Count) proyectos ($ThrottleLimit en paralelo)..." -ForegroundColor Cyan
+                $whatIf = [bool]$WhatIfPreference
+                $modulePath = Join-Path $script:ModuleRoot "m8bits.psd1"
+                $results = $targets | ForEach-Object -ThrottleLimit $ThrottleLimit -Parallel {
+                    $module = Get-Module m8bits
+                    if (-not $module) {
+                        $module = Import-Module $using:modulePath -PassThru
+                    }
+                    # $WhatIfPreference no llega a los runspaces: se pasa explicitamente
+                    & $module {
+                        param($ProjectPath, $HotDays, $RetentionDays, $MaxSizeMB, $WhatIf)
+                        Import-M8bitsCommand -Name logs
+                        Compress-ClaudeLog -Path $ProjectPath -HotDays $HotDays -RetentionDays $RetentionDays -MaxSizeMB $MaxSizeMB -WhatIf:$WhatIf
+                    } $_ $using:HotDays $using:RetentionDays $using:MaxSizeMB $using:whatIf
+                }
+            }
+            $watch.Stop()
+            Write-ClaudeLogCompactReport -Results $results -Elapsed $watch.Elapsed
+        }
+    }
+}
+
+function script:Search-ClaudeLog {
+    <#
+    .SYNOPSIS
+    Busca texto en el historial sin cargarlo en memoria.
+
+    .DESCRIPTION
+    Recorre los archivos de logs_system/logs del mas reciente al mas antiguo
+    y los lee linea a linea (Select-String, o descomprimiendo al vuelo los
+    segmentos .gz con -IncludeArchived). La busqueda se detiene en cuanto se
+    completa la pagina pedida (-Skip/-First), asi que las primeras paginas
+    no dependen del tamano total del historial.
+
+    Para texto literal solo se leen los archivos cuyo indice contiene todas
+    las palabras de la consulta (ver Update-ClaudeLogIndex). Con -Regex se
+    leen todos. Las palabras de mas de 64 caracteres no se indexan, asi que
+    un texto que solo aparece dentro de un blob base64 no se encuentra.
+    #>
+    [CmdletBinding()]
+    param(
+        [Parameter(Mandatory)]
+        [string]$Path,
+
+        [Parameter(Mandatory)]
+        [string]$Query,
+
+        [int]$First = 50,
+
+        [int]$Skip = 0,
+
+        [switch]$Regex,
+
+        [switch]$IncludeArchived
+    )
+
+    $logsPath = Join-Path $Path ".claude" "logs_system" "logs"
+    if (-not (Test-Path -LiteralPath $logsPath)) {
+        Write-Host "[!] No se encontro la carpeta de logs: $logsPath" -ForegroundColor Yellow
+        return
+    }
+
+    $pattern = if ($Regex) { $Query } else { [regex]::Escape($Query) }
+    try {
+        $matcher = [regex]::new($pattern, [System.Text.RegularExpressions.RegexOptions]::IgnoreCase)
+    }
+    catch {
+        Write-Host "[X] Expresion regular invalida: $($_.Exception.GetBaseException().Message)" -ForegroundColor Red
+        return
+    }
+
+    $include = $script:LogTextPatterns
+    if ($IncludeArchived) {
+        $include += $script:LogTextPatterns | ForEach-Object { "$_$script:LogArchiveExtension" }
+    }
+
+    $files = Get-ChildItem -LiteralPath $logsPath -Recurse -File -Force -Include $include |
+        Sort-Object LastWriteTimeUtc -Descending
+
+    if (-not $Regex) {
+        $probes = @(Get-LogQueryProbe -Query $Query)
+        if ($probes) {
+            $index = Update-ClaudeLogIndex -Path $Path -Files @($files)
+            $files = $files | Where-Object {
+                $tokens = $index[[System.IO.Path]::GetRelativePath($logsPath, $_.FullName)].Tokens
+                foreach ($probe in $probes) {
+                    if (-not $tokens.Contains($probe)) {
+                        return $false
+                    }
+                }
+                return $true
+            }
+        }
+    }
+
+    $files |
+        ForEach-Object {
+            if ($_.Extension -eq $script:LogArchiveExtension) {
+                Select-ArchivedLogLine -Path $_.FullName -Matcher $matcher
+            }
+            else {
+                $_ | Select-String -Pattern $pattern
+            }
+        } |
+        Select-Object -Skip $Skip -First $First |
+        ForEach-Object {
+            # Fragmento alrededor de la coincidencia para no volcar lineas JSON enteras
+            $line = $_.Line
+            $start = [math]::Max(0, $matcher.Match($line).Index - 80)
+            $length = [math]::Min(200, $line.Length - $start)
+            [PSCustomObject]@{
+                Session = [System.IO.Path]::GetRelativePath($logsPath, $_.Path)
+                Line = $_.LineNumber
+                Text = $line.Substring($start, $length).Trim()
+            }
+        }
+}
+
+function script:Get-LogQueryProbe {
+    # Fragmentos que deben aparecer en la lista de palabras de un archivo
+    # ("`npalabra1`npalabra2`n...") para que pueda contener la consulta.
+    # Las palabras interiores de la consulta son completas; la primera puede
+    # ser el final de una palabra y la ultima el principio de otra.
+    param(
+        [Parameter(Mandatory)]
+        [string]$Query
+    )
+
+    $parts = [regex]::Split($Query.ToLowerInvariant(), '\W+')
+    $last = $parts.Count - 1
+    for ($i = 0; $i -le $last; $i++) {
+        if (-not $parts[$i]) {
+            continue
+        }
+        $left = if ($i -gt 0) { "`n" } else { "" }
+        $right = if ($i -lt $last) { "`n" } else { "" }
+        "$left$($parts[$i])$right"
+    }
+}
+
+function script:Update-ClaudeLogIndex {
+    <#
+    .SYNOPSIS
+    Actualiza y devuelve el indice de palabras del historial de un proyecto.
+
+    .DESCRIPTION
+    Guarda, por archivo de logs, sus palabras distintas en minusculas. Se
+    actualiza en cada busqueda: solo se vuelven a leer los archivos cuyo
+    tamano o fecha cambiaron (como la cache del manifiesto) y se descartan
+    los que ya no existen. Devuelve un hashtable ruta relativa -> entrada.
+    #>
+    param(
+        [Parameter(Mandatory)]
+        [string]$Path,
+
+        [Parameter(Mandatory)]
+        [AllowEmptyCollection()]
+        [System.IO.FileInfo[]]$Files
+    )
+
+    $logsPath = Join-Path $Path ".claude" "logs_system" "logs"
+    $dataPath = Join-Path $Path ".claude" "logs_system" "data"
+    $indexFile = Join-Path $dataPath $script:LogIndexFileName
+
+    $cached = @{}
+    if (Test-Path -LiteralPath $indexFile) {
+        try {
+            $data = Get-Content -LiteralPath $indexFile -Raw | ConvertFrom-Json -AsHashtable
+            if ($data.MaxToken -eq $script:LogIndexMaxToken -and $data.Files) {
+                $cached = $data.Files
+            }
+        }
+        catch {
+            Write-Verbose "Indice de busqueda invalido, se reconstruye: $_"
+        }
+    }
+
+    # Las entradas de archivos que ya no existen (p. ej. comprimidos) se descartan
+    $entries = @{}
+    foreach ($relative in $cached.Keys) {
+        if (Test-Path -LiteralPath (Join-Path $logsPath $relative) -PathType Leaf) {
+            $entries[$relative] = $cached[$relative]
+        }
+    }
+    $dirty = $entries.Count -ne $cached.Count
+
+    foreach ($file in $Files) {
+        $relative = [System.IO.Path]::GetRelativePath($logsPath, $file.FullName)
+        $ticks = $file.LastWriteTimeUtc.Ticks
+        $entry = $entries[$relative]
+        if (-not $entry -or $entry.Length -ne $file.Length -or $entry.LastWriteUtc -ne $ticks) {
+            $entries[$relative] = @{
+                Length = $file.Length
+                LastWriteUtc = $ticks
+                Tokens = Get-LogFileToken -File $file
+            }
+            $dirty = $true
+        }
+    }
+
+    if ($dirty) {
+        try {
+            if (-not (Test-Path -LiteralPath $dataPath)) {
+                New-Item -ItemType Directory -Path $dataPath -Force | Out-Null
+            }
+            @{ MaxToken = $script:LogIndexMaxToken; Files = $entries } |
+                ConvertTo-Json -Depth 4 -Compress |
+                Set-Content -LiteralPath $indexFile -Encoding utf8
+        }
+        catch {
+            Write-Verbose "No se pudo guardar el indice de busqueda: $_"
+        }
+    }
+
+    return $entries
+}
+
+function script:Get-LogFileToken {
+    # Palabras distintas de un archivo (descomprimiendo los .gz) como "`na`nb`n"
+    param(
+        [Parameter(Mandatory)]
+        [System.IO.FileInfo]$File
+    )
+
+    $stream = [System.IO.File]::OpenRead($File.FullName)
+    if ($File.Extension -eq $script:LogArchiveExtension) {
+        $stream = [System.IO.Compression.GZipStream]::new($stream, [System.IO.Compression.CompressionMode]::Decompress)
+    }
+    $reader = [System.IO.StreamReader]::new($stream)
+    $tokens = [System.Collections.Generic.HashSet[string]]::new([System.StringComparer]::Ordinal)
+    try {
+        # Por bloques para no cargar archivos grandes enteros en memoria
+        $buffer = [char[]]::new(1MB)
+        $carry = ""
+        while (($read = $reader.Read($buffer, 0, $buffer.Length)) -gt 0) {
+            $text = $carry + [string]::new($buffer, 0, $read)
+            $parts = [regex]::Split($text.ToLowerInvariant(), '\W+')
+            # La ultima palabra puede continuar en el siguiente bloque
+            $carry = $parts[-1]
+            $parts[-1] = ""
+            $tokens.UnionWith([string[]]$parts)
+        }
+        $tokens.Add($carry) | Out-Null
+    }
+    finally {
+        $reader.Dispose()
+    }
+
+    $maxToken = $script:LogIndexMaxToken
+    $tokens.RemoveWhere([Predicate[string]]{ param($token) $token.Length -eq 0 -or $token.Length -gt $maxToken }) | Out-Null
+    return "`n" + ($tokens -join "`n") + "`n"
+}
+
+function script:Select-ArchivedLogLine {
+    # Equivalente a Select-String para un segmento .gz, leyendo en streaming
+    param(
+        [Parameter(Mandatory)]
+        [string]$Path,
+
+        [Parameter(Mandatory)]
+        [regex]$Matcher
+    )
+
+    $file = [System.IO.File]::OpenRead($Path)
+    $gzip = [System.IO.Compression.GZipStream]::new($file, [System.IO.Compression.CompressionMode]::Decompress)
+    $reader = [System.IO.StreamReader]::new($gzip)
+    try {
+        $number = 0
+        while ($null -ne ($line = $reader.ReadLine())) {
+            $number++
+            if ($Matcher.IsMatch($line)) {
+                [PSCustomObject]@{ Path = $Path; LineNumber = $number; Line = $line }
+            }
+        }
+    }
+    finally {
+        $reader.Dispose()
+    }
+}
+
+function script:Compress-ClaudeLog {
+    <#
+    .SYNOPSIS
+    Comprime los logs antiguos de un proyecto y aplica la retencion.
+
+    .DESCRIPTION
+    Los archivos de historial no modificados en los ultimos -HotDays dias se
+    comprimen en streaming a <archivo>.gz (conservando su fecha) y se borra
+    el original; si <archivo>.gz ya existe se le agrega un miembro gzip.
+    Despues se borran los .gz con mas de -RetentionDays dias y, si la
+    carpeta supera -MaxSizeMB, los .gz mas antiguos hasta cumplirlo.
+    Los archivos recientes nunca se borran. Devuelve un objeto con los
+    bytes antes/despues y el tiempo empleado. Con -WhatIf no se modifica
+    nada: Compressed/Deleted y BytesAfter reflejan lo que se haria, con el
+    tamano comprimido calculado en memoria.
+    #>
+    [CmdletBinding(SupportsShouldProcess)]
+    param(
+        [Parameter(Mandatory)]
+        [string]$Path,
+
+        [int]$HotDays = 7,
+
+        [int]$RetentionDays = 0,
+
+        [double]$MaxSizeMB = 0
+    )
+
+    $watch = [System.Diagnostics.Stopwatch]::StartNew()
+    $row = [ordered]@{
+        Project = $Path
+        Compressed = 0
+        Deleted = 0
+        BytesBefore = 0L
+        BytesAfter = 0L
+        Seconds = 0
+        Error = $null
+    }
+
+    $logsPath = Join-Path $Path ".claude" "logs_system" "logs"
+    try {
+        if (-not (Test-Path -LiteralPath $logsPath)) {
+            $row.Error = "No se encontro la carpeta de logs"
+        }
+        else {
+            $row.BytesBefore = [long](Get-ChildItem -LiteralPath $logsPath -Recurse -File -Force | Measure-Object Length -Sum).Sum
+
+            $now = [DateTime]::UtcNow
+            $hotLimit = $now.AddDays(-$HotDays)
+            $cold = Get-ChildItem -LiteralPath $logsPath -Recurse -File -Force -Include $script:LogTextPatterns |
+                Where-Object LastWriteTimeUtc -lt $hotLimit
+
+            # Con -WhatIf no se comprime, pero se calcula el tamano comprimido de
+            # cada archivo para que la retencion y -MaxSizeMB se simulen sobre los
+            # .gz que existirian, como en una ejecucion real
+            $pending = [System.Collections.Generic.List[object]]::new()
+            $simulated = 0L
+            foreach ($file in $cold) {
+                if ($PSCmdlet.ShouldProcess($file.FullName, "Comprimir")) {
+                    Compress-LogFile -File $file
+                    $row.Compressed++
+                }
+                elseif ($WhatIfPreference) {
+                    $length = Measure-LogFileCompression -File $file
+                    $pending.Add([PSCustomObject]@{
+                        FullName = "$($file.FullName)$script:LogArchiveExtension"
+                        Length = $length
+                        LastWriteTimeUtc = $file.LastWriteTimeUtc
+                        Pending = $true
+                    })
+                    $simulated += $file.Length - $length
+                    $row.Compressed++
+                }
+            }
+
+            $archives = [System.Collections.Generic.List[object]]::new()
+            $candidates = @(Get-ChildItem -LiteralPath $logsPath -Recurse -File -Force -Filter "*$script:LogArchiveExtension") + $pending
+            foreach ($archive in $candidates | Sort-Object LastWriteTimeUtc) {
+                if ($RetentionDays -gt 0 -and $archive.LastWriteTimeUtc -lt $now.AddDays(-$RetentionDays)) {
+                    if ($archive.Pending -or -not $PSCmdlet.ShouldProcess($archive.FullName, "Borrar (mas de $RetentionDays dias)")) {
+                        if ($WhatIfPreference) {
+                            $simulated += $archive.Length
+                            $row.Deleted++
+                        }
+                        else {
+                            $archives.Add($archive)
+                        }
+                    }
+                    else {
+                        Remove-Item -LiteralPath $archive.FullName -Force -WhatIf:$false -Confirm:$false
+                        $row.Deleted++
+                    }
+                }
+                else {
+                    $archives.Add($archive)
+                }
+            }
+
+            if ($MaxSizeMB -gt 0) {
+                $limit = [long]($MaxSizeMB * 1MB)
+                $total = [long](Get-ChildItem -LiteralPath $logsPath -Recurse -File -Force | Measure-Object Length -Sum).Sum - $simulated
+                foreach ($archive in $archives) {
+                    if ($total -le $limit) {
+                        break
+                    }
+                    if ($archive.Pending -or -not $PSCmdlet.ShouldProcess($archive.FullName, "Borrar (limite de $MaxSizeMB MB)")) {
+                        if ($WhatIfPreference) {
+                            $simulated += $archive.Length
+                            $total -= $archive.Length
+                            $row.Deleted++
+                        }
+                    }
+                    else {
+                        Remove-Item -LiteralPath $archive.FullName -Force -WhatIf:$false -Confirm:$false
+                        $total -= $archive.Length
+                        $row.Deleted++
+                    }
+                }
+            }
+
+            $row.BytesAfter = [long](Get-ChildItem -LiteralPath $logsPath -Recurse -File -Force | Measure-Object Length -Sum).Sum - $simulated
+        }
+    }
+    catch {
+        $row.Error = "$_"
+    }
+
+    $row.Seconds = [math]::Round($watch.Elapsed.TotalSeconds, 2)
+    return [PSCustomObject]$row
+}
+
+function script:Measure-LogFileCompression {
+    # Tamano que tendria un archivo comprimido (para simular -WhatIf) sin escribir nada
+    param(
+        [Parameter(Mandatory)]
+        [System.IO.FileInfo]$File
+    )
+
+    $source = [System.IO.File]::OpenRead($File.FullName)
+    $output = [System.IO.MemoryStream]::new()
+    try {
+        $gzip = [System.IO.Compression.GZipStream]::new($output, [System.IO.Compression.CompressionLevel]::Optimal, $true)
+        try {
+            $source.CopyTo($gzip)
+        }
+        finally {
+            $gzip.Dispose()
+        }
+        return $output.Length
+    }
+    finally {
+        $output.Dispose()
+        $source.Dispose()
+    }
+}
+
+function script:Compress-LogFile {
+    param(
+        [Parameter(Mandatory)]
+        [System.IO.FileInfo]$File
+    )
+
+    $target = "$($File.FullName)$script:LogArchiveExtension"
+    $staging = "$target.tmp"
+
+    # Si ya hay un segmento con ese nombre (el log se volvio a crear) no se
+    # sobrescribe: se le agrega un miembro gzip nuevo sobre una copia, ya que
+    # gzip admite miembros concatenados y GZipStream los lee todos
+    $mtime = $File.LastWriteTimeUtc
+    $existing = Get-Item -LiteralPath $target -Force -ErrorAction SilentlyContinue
+    if ($existing -and $existing.LastWriteTimeUtc -gt $mtime) {
+        $mtime = $existing.LastWriteTimeUtc
+    }
+
+    # El llamador ya decidio con ShouldProcess: aqui no se vuelve a preguntar
+    try {
+        $source = [System.IO.File]::OpenRead($File.FullName)
+        try {
+            if ($existing) {
+                Copy-Item -LiteralPath $target -Destination $staging -Force -WhatIf:$false -Confirm:$false
+                $output = [System.IO.File]::Open($staging, [System.IO.FileMode]::Append)
+            }
+            else {
+                $output = [System.IO.File]::Create($staging)
+            }
+            try {
+                $gzip = [System.IO.Compression.GZipStream]::new($output, [System.IO.Compression.CompressionLevel]::Optimal)
+                try {
+                    $source.CopyTo($gzip)
+                }
+                finally {
+                    $gzip.Dispose()
+                }
+            }
+            finally {
+                $output.Dispose()
+            }
+        }
+        finally {
+            $source.Dispose()
+        }
+
+        Move-Item -LiteralPath $staging -Destination $target -Force -WhatIf:$false -Confirm:$false
+    }
+    catch {
+        Remove-Item -LiteralPath $staging -Force -ErrorAction SilentlyContinue -WhatIf:$false -Confirm:$false
+        throw
+    }
+
+    # La fecha del original (o del segmento previo, si es mas reciente) se
+    # conserva para ordenar y aplicar la retencion
+    [System.IO.File]::SetLastWriteTimeUtc($target, $mtime)
+    Remove-Item -LiteralPath $File.FullName -Force -WhatIf:$false -Confirm:$false
+}
+
+function script:Write-ClaudeLogCompactReport {
+    param(
+        [Parameter(Mandatory)]
+        [object[]]$Results,
+
+        [Parameter(Mandatory)]
+        [TimeSpan]$Elapsed
+    )
+
+    $Results | Sort-Object Project |
+        Format-Table Project, Compressed, Deleted,
+            @{ Name = "BeforeMB"; Expression = { [math]::Round($_.BytesBefore / 1MB, 1) } },
+            @{ Name = "AfterMB"; Expression = { [math]::Round($_.BytesAfter / 1MB, 1) } },
+            @{ Name = "ReclaimedMB"; Expression = { [math]::Round(($_.BytesBefore - $_.BytesAfter) / 1MB, 1) } },
+            Seconds -AutoSize |
+        Out-Host
+
+    $errors = @($Results | Where-Object Error)
+    foreach ($row in $errors) {
+        Write-Host "  [!] $($row.Project): $($row.Error)" -ForegroundColor Yellow
+    }
+
+    $reclaimed = 0L
+    foreach ($row in $Results) {
+        $reclaimed += $row.BytesBefore - $row.BytesAfter
+    }
+    Write-Host ("[OK] {0} proyectos en {1:N2} s. Recuperados: {2:N1} MB" -f
+        $Results.Count, $Elapsed.TotalSeconds, ($reclaimed / 1MB)) -ForegroundColor Green
+}
@@ -0,0 +1,62 @@
+# Subcomando 'pack' - se carga bajo demanda desde m8bits.psm1
+
+Import-M8bitsLibrary -Name templates
+
+function script:Export-TemplateBundle {
+    <#
+    .SYNOPSIS
+    Empaqueta templates/ en templates-<version>.zip junto con su indice.
+
+    .DESCRIPTION
+    El paquete contiene todos los archivos de la plantilla y el manifiesto
+    (m8bits-index.json). Cuando existe, el modulo lee el indice en lugar de
+    recorrer templates/ y extrae el almacen compartido desde el paquete.
+    Se debe volver a generar cada vez que cambie la plantilla.
+    #>
+    [CmdletBinding()]
+    param()
+
+    if (-not (Test-Path $script:ClaudeCleanPath)) {
+        Write-Host "[X] No se encontro la carpeta fuente: $script:ClaudeCleanPath" -ForegroundColor Red
+        return
+    }
+
+    $bundlePath = Get-TemplateBundlePath
+    $version = "$($MyInvocation.MyCommand.Module.Version)"
+    $files = Get-TemplateFolderManifest
+    $staging = "$bundlePath.tmp"
+
+    try {
+        Add-Type -AssemblyName System.IO.Compression.ZipFile
+        if (Test-Path -LiteralPath $staging) {
+            Remove-Item -LiteralPath $staging -Force
+        }
+
+        $zip = [System.IO.Compression.ZipFile]::Open($staging, [System.IO.Compression.ZipArchiveMode]::Create)
+        try {
+            foreach ($relative in $files.Keys | Sort-Object) {
+                $sourceFile = Join-Path $script:ClaudeCleanPath $relative
+                [System.IO.Compression.ZipFileExtensions]::CreateEntryFromFile($zip, $sourceFile, $relative, [System.IO.Compression.CompressionLevel]::Optimal) | Out-Null
+            }
+
+            $index = @{ Version = $version; Digest = (Get-TemplateDigest -Manifest $files); Files = $files }
+            $writer = [System.IO.StreamWriter]::new($zip.CreateEntry($script:BundleIndexName).Open())
+            try {
+                $writer.Write(($index | ConvertTo-Json -Depth 4 -Compress))
+            }
+            finally {
+                $writer.Dispose()
+            }
+        }
+        finally {
+            $zip.Dispose()
+        }
+
+        Move-Item -LiteralPath $staging -Destination $bundlePath -Force
+        $script:TemplateManifest = $null
+        Write-Host "[OK] Paquete generado: $bundlePath ($($files.Count) archivos)." -ForegroundColor Green
+    }
+    catch {
+        Write-Host "[X] Error al empaquetar: $_" -ForegroundColor Red
+    }
+}
@@ -0,0 +1,62 @@
+# Subcomando 'stats' - se carga bajo demanda desde m8bits.psm1
+
+Import-M8bitsLibrary -Name metrics
+
+function script:Show-ClaudeStats {
+    <#
+    .SYNOPSIS
+    Resume las metricas guardadas por 'm8bits bench' y el crecimiento de los logs.
+
+    .DESCRIPTION
+    Lee el archivo de metricas del proyecto y muestra p50/p99 por fase y por
+    hook. Despues muestra el tamano de logs_system/logs: sesiones, tamano
+    medio por sesion y lo que crecio en los ultimos -Days dias.
+
+    .PARAMETER Path
+    Directorio del proyecto (por defecto, el directorio actual).
+
+    .PARAMETER Suite
+    Filtra las metricas: init o hooks.
+
+    .PARAMETER Days
+    Ventana para calcular el crecimiento reciente de los logs.
+
+    .EXAMPLE
+    m8bits stats -Suite hooks
+    #>
+    [CmdletBinding()]
+    param(
+        [string]$Path = (Get-Location),
+
+        [ValidateSet("init", "hooks")]
+        [string]$Suite,
+
+        [ValidateRange(1, 3650)]
+        [int]$Days = 7
+    )
+
+    $samples = @(Read-M8bitsMetric -Path $Path -Suite $Suite)
+    if ($samples) {
+        Write-Host "Metricas ($($samples.Count) muestras en $(Get-M8bitsMetricsPath -Path $Path)):" -ForegroundColor Cyan
+        Measure-M8bitsMetric -Samples $samples | Sort-Object Suite, Name | Format-Table -AutoSize | Out-Host
+    }
+    else {
+        Write-Host "[!] No hay metricas guardadas. Ejecuta 'm8bits bench init' o 'm8bits bench hooks'." -ForegroundColor Yellow
+    }
+
+    $logsPath = Join-Path $Path ".claude" "logs_system" "logs"
+    if (-not (Test-Path -LiteralPath $logsPath)) {
+        return
+    }
+
+    $files = @(Get-ChildItem -LiteralPath $logsPath -Recurse -File -Force)
+    $total = [long]($files | Measure-Object Length -Sum).Sum
+    $since = [DateTime]::UtcNow.AddDays(-$Days)
+    $recent = @($files | Where-Object LastWriteTimeUtc -ge $since)
+    $recentBytes = [long]($recent | Measure-Object Length -Sum).Sum
+    $average = if ($files.Count) { $total / $files.Count } else { 0 }
+
+    Write-Host "Logs ($logsPath):" -ForegroundColor Cyan
+    Write-Host ("  Archivos: {0}  Total: {1:N1} MB  Media por archivo: {2:N1} KB" -f $files.Count, ($total / 1MB), ($average / 1KB)) -ForegroundColor Gray
+    Write-Host ("  Ultimos {0} dias: {1} archivos, {2:N1} MB ({3:N1} MB/dia)" -f $Days, $recent.Count, ($recentBytes / 1MB), ($recentBytes / 1MB / $Days)) -ForegroundColor Gray
+}
@@ -0,0 +1,46 @@
+# Subcomando 'sync' - se carga bajo demanda desde m8bits.psm1
+
+Import-M8bitsLibrary -Name templates
+
+function script:Sync-ClaudeProject {
+    <#
+    .SYNOPSIS
+    Actualiza la configuracion .claude del directorio actual de forma incremental.
+
+    .DESCRIPTION
+    Compara el hash de cada archivo de la plantilla con el del proyecto y solo
+    copia los que cambiaron. Los archivos editados localmente se conservan
+    salvo que se indique -Force.
+
+    .PARAMETER Path
+    Directorio del proyecto (por defecto, el directorio actual).
+
+    .PARAMETER Force
+    Sobrescribe tambien los archivos modificados localmente.
+
+    .PARAMETER LinkMode
+    Copy (por defecto), HardLink o SymbolicLink para los recursos inmutables.
+    #>
+    [CmdletBinding()]
+    param(
+        [string]$Path = (Get-Location),
+
+        [switch]$Force,
+
+        [ValidateSet("Copy", "HardLink", "SymbolicLink")]
+        [string]$LinkMode = "Copy"
+    )
+
+    if (-not (Test-TemplateSource)) {
+        Write-Host "[X] No se encontro la carpeta fuente: $script:ClaudeCleanPath" -ForegroundColor Red
+        return
+    }
+
+    try {
+        $result = Sync-ClaudeTemplate -TargetPath $Path -Force:$Force -LinkMode $LinkMode
+        Write-TemplateSyncReport -Result $result
+    }
+    catch {
+        Write-Host "[X] Error al sincronizar: $_" -ForegroundColor Red
+    }
+}
@@ -0,0 +1,123 @@
+# Libreria de metricas - guarda y resume las mediciones de 'm8bits bench'.
+# Cada muestra es una linea JSON en .claude/logs_system/data/m8bits-metrics.jsonl,
+# o en la cache del usuario si el directorio no es un proyecto con .claude.
+
+$script:MetricsFileName = "m8bits-metrics.jsonl"
+
+function script:Get-M8bitsMetricsPath {
+    # No se crea .claude en directorios que no son proyectos
+    param(
+        [Parameter(Mandatory)]
+        [string]$Path
+    )
+
+    # Ruta absoluta: Read-M8bitsMetric la abre con .NET, que no usa Get-Location
+    $Path = $ExecutionContext.SessionState.Path.GetUnresolvedProviderPathFromPSPath($Path)
+    if (Test-Path -LiteralPath (Join-Path $Path ".claude") -PathType Container) {
+        return Join-Path $Path ".claude" "logs_system" "data" $script:MetricsFileName
+    }
+    return Join-Path (Get-M8bitsCachePath) $script:MetricsFileName
+}
+
+function script:Add-M8bitsMetric {
+    <#
+    .SYNOPSIS
+    Agrega muestras (Suite, Name, Ms y opcionalmente Error) al archivo de metricas.
+    #>
+    param(
+        [Parameter(Mandatory)]
+        [string]$Path,
+
+        [Parameter(Mandatory)]
+        [object[]]$Samples
+    )
+
+    $metricsPath = Get-M8bitsMetricsPath -Path $Path
+    $folder = Split-Path $metricsPath -Parent
+    if (-not (Test-Path -LiteralPath $folder)) {
+        New-Item -ItemType Directory -Path $folder -Force | Out-Null
+    }
+
+    $timestamp = [DateTime]::UtcNow.ToString("o")
+    $version = "$($MyInvocation.MyCommand.Module.Version)"
+    $lines = foreach ($sample in $Samples) {
+        [ordered]@{
+            Timestamp = $timestamp
+            Version = $version
+            Suite = $sample.Suite
+            Name = $sample.Name
+            Ms = [math]::Round($sample.Ms, 3)
+            Error = [bool]$sample.Error
+        } | ConvertTo-Json -Compress
+    }
+    Add-Content -LiteralPath $metricsPath -Value $lines -Encoding utf8
+}
+
+function script:Read-M8bitsMetric {
+    param(
+        [Parameter(Mandatory)]
+        [string]$Path,
+
+        [string]$Suite
+    )
+
+    $metricsPath = Get-M8bitsMetricsPath -Path $Path
+    if (-not (Test-Path -LiteralPath $metricsPath)) {
+        return
+    }
+
+    foreach ($line in [System.IO.File]::ReadLines($metricsPath)) {
+        if (-not $line) {
+            continue
+        }
+        # Una linea a medias (p. ej. un bench interrumpido) no invalida el resto
+        try {
+            $sample = $line | ConvertFrom-Json
+        }
+        catch {
+            Write-Verbose "Linea de metricas ignorada: $line"
+            continue
+        }
+        if (-not $Suite -or $sample.Suite -eq $Suite) {
+            $sample
+        }
+    }
+}
+
+function script:Get-M8bitsPercentile {
+    param(
+        [Parameter(Mandatory)]
+        [double[]]$Values,
+
+        [Parameter(Mandatory)]
+        [double]$Percent
+    )
+
+    $sorted = [double[]]($Values | Sort-Object)
+    $index = [math]::Ceiling($Percent / 100 * $sorted.Count) - 1
+    return $sorted[[math]::Max(0, $index)]
+}
+
+function script:Measure-M8bitsMetric {
+    <#
+    .SYNOPSIS
+    Resume muestras por Suite y Name: cantidad, p50, p99, maximo y errores.
+    #>
+    param(
+        [Parameter(Mandatory)]
+        [object[]]$Samples
+    )
+
+    foreach ($group in $Samples | Group-Object Suite, Name) {
+        $values = [double[]]@($group.Group | ForEach-Object { $_.Ms })
+        [PSCustomObject]@{
+            Suite = $group.Group[0].Suite
+            Name = $group.Group[0].Name
+            Count = $values.Count
+            P50Ms = [math]::Round((Get-M8bitsPercentile -Values $values -Percent 50), 1)
+            P99Ms = [math]::Round((Get-M8bitsPercentile -Values $values -Percent 99), 1)
+            MaxMs = [math]::Round(($values | Measure-Object -Maximum).Maximum, 1)
+            Errors = @($group.Group | Where-Object Error).Count
+        }
+    }
+}
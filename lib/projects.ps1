@@ -0,0 +1,52 @@
+# Libreria de proyectos - resuelve las carpetas sobre las que operan los
+# subcomandos que trabajan con varios proyectos a la vez (bulk, logs compact).
+
+function script:Find-ClaudeProject {
+    <#
+    .SYNOPSIS
+    Devuelve las rutas (unicas y ordenadas) de los proyectos indicados.
+
+    .DESCRIPTION
+    -Path admite rutas y comodines; solo se devuelven carpetas y se avisa
+    (Write-Warning) de cada entrada que no existe o no es una carpeta.
+    -Root busca repositorios git (carpetas que contienen .git) hasta -Depth
+    niveles.
+    #>
+    param(
+        [string[]]$Path,
+
+        [string]$Root,
+
+        [int]$Depth = 3
+    )
+
+    $targets = [System.Collections.Generic.List[string]]::new()
+    foreach ($item in $Path) {
+        # Una ruta mal escrita no debe desaparecer en silencio de una lista larga
+        $resolvedItems = @(Resolve-Path -Path $item -ErrorAction SilentlyContinue)
+        if (-not $resolvedItems) {
+            Write-Warning "No se encontro el proyecto: $item"
+            continue
+        }
+        foreach ($resolved in $resolvedItems) {
+            if (Test-Path -LiteralPath $resolved.ProviderPath -PathType Container) {
+                $targets.Add($resolved.ProviderPath)
+            }
+            else {
+                Write-Warning "No es una carpeta, se ignora: $($resolved.ProviderPath)"
+            }
+        }
+    }
+
+    if ($Root) {
+        if (-not (Test-Path $Root -PathType Container)) {
+            throw "No se encontro la carpeta raiz: $Root"
+        }
+        # .git puede ser carpeta (repo) o archivo (worktree/submodulo)
+        foreach ($git in Get-ChildItem -Path $Root -Filter ".git" -Recurse -Force -Depth $Depth -ErrorAction SilentlyContinue) {
+            $targets.Add((Split-Path $git.FullName -Parent))
+        }
+    }
+
+    return @($targets | Sort-Object -Unique)
+}
@@ -0,0 +1,526 @@
+# Libreria de plantillas - manifiesto, paquete, almacen compartido y sincronizacion.
+# Se carga bajo demanda con Import-M8bitsLibrary desde los subcomandos que la usan.
+
+# Registro de lo desplegado en cada proyecto (dentro de .claude/)
+$script:StateFileName = ".m8bits-state.json"
+
+# Manifiesto de templates/ en memoria (se construye una vez por sesion)
+$script:TemplateManifest = $null
+
+# Nombre del indice dentro del paquete templates-<version>.zip
+$script:BundleIndexName = "m8bits-index.json"
+
+# Marca de almacen compartido completo (se escribe al final de la extraccion)
+$script:StoreMarkerName = ".m8bits-store"
+
+# Recursos inmutables que pueden enlazarse desde el almacen compartido
+$script:SharedAssetPaths = @(
+    ".claude/logs_system/hooks/",
+    ".claude/logs_system/chat_viewer/",
+    ".claude/logs_system/docs/"
+)
+
+function script:Test-TemplateSource {
+    # La plantilla puede venir de templates/ o del paquete templates-<version>.zip
+    return (Test-Path $script:ClaudeCleanPath) -or (Test-Path -LiteralPath (Get-TemplateBundlePath))
+}
+
+function script:Get-TemplateBundlePath {
+    return Join-Path $script:ModuleRoot "templates-$($MyInvocation.MyCommand.Module.Version).zip"
+}
+
+function script:Get-TemplateManifest {
+    <#
+    .SYNOPSIS
+    Devuelve el manifiesto de la plantilla: ruta relativa -> Hash, Length, LastWriteUtc.
+
+    .DESCRIPTION
+    Si existe el paquete templates-<version>.zip se usa su indice; si no, se
+    recorre templates/. En ambos casos se lee una sola vez por sesion.
+    Si templates/ tiene algo mas reciente que el paquete, el paquete se
+    considera desactualizado y se usa templates/.
+    #>
+    $version = "$($MyInvocation.MyCommand.Module.Version)"
+    if ($script:TemplateManifest -and $script:TemplateManifest.Version -eq $version) {
+        return $script:TemplateManifest.Files
+    }
+
+    $bundlePath = Get-TemplateBundlePath
+    if ((Test-Path -LiteralPath $bundlePath) -and (Test-TemplateBundleStale -Path $bundlePath)) {
+        Write-Warning "El paquete $bundlePath es anterior a cambios en templates/; se usa templates/. Ejecuta 'm8bits pack' para regenerarlo."
+    }
+    elseif (Test-Path -LiteralPath $bundlePath) {
+        $files = Read-TemplateBundleIndex -Path $bundlePath
+        $script:TemplateManifest = @{ Version = $version; Files = $files; Bundle = $bundlePath }
+        return $files
+    }
+
+    $files = Get-TemplateFolderManifest
+    $script:TemplateManifest = @{ Version = $version; Files = $files; Bundle = $null }
+    return $files
+}
+
+function script:Test-TemplateBundleStale {
+    # El paquete esta desactualizado si algun archivo o carpeta de templates/ es mas reciente
+    param(
+        [Parameter(Mandatory)]
+        [string]$Path
+    )
+
+    if (-not (Test-Path $script:ClaudeCleanPath)) {
+        return $false
+    }
+
+    $packed = (Get-Item -LiteralPath $Path -Force).LastWriteTimeUtc
+    foreach ($item in Get-ChildItem -LiteralPath $script:ClaudeCleanPath -Recurse -Force) {
+        if ($item.LastWriteTimeUtc -gt $packed) {
+            return $true
+        }
+    }
+    return $false
+}
+
+function script:Get-TemplateFolderManifest {
+    <#
+    .SYNOPSIS
+    Recorre templates/ (o -SourcePath) y calcula el hash de cada archivo.
+
+    .DESCRIPTION
+    El resultado se guarda en la cache del usuario por version del modulo
+    (o en -CacheFile). Al cargarlo solo se vuelven a hashear los archivos
+    cuyo tamano o fecha cambiaron; la cache se descarta si es de otra fuente.
+    #>
+    param(
+        [string]$SourcePath = $script:ClaudeCleanPath,
+
+        [string]$CacheFile
+    )
+
+    $version = "$($MyInvocation.MyCommand.Module.Version)"
+    if (-not $CacheFile) {
+        $CacheFile = Join-Path (Get-M8bitsCachePath) "manifest-$version.json"
+    }
+    $cached = @{}
+    if (Test-Path $CacheFile) {
+        try {
+            $data = Get-Content -LiteralPath $CacheFile -Raw | ConvertFrom-Json -AsHashtable
+            if ($data.Source -eq $SourcePath -and $data.Files) {
+                $cached = $data.Files
+            }
+        }
+        catch {
+            Write-Verbose "Cache de manifiesto invalida, se reconstruye: $_"
+        }
+    }
+
+    $files = @{}
+    $dirty = $false
+    foreach ($item in Get-ChildItem -LiteralPath $SourcePath -Recurse -File -Force) {
+        $relative = [System.IO.Path]::GetRelativePath($SourcePath, $item.FullName) -replace '\\', '/'
+        $ticks = $item.LastWriteTimeUtc.Ticks
+        $entry = $cached[$relative]
+        if (-not $entry -or $entry.Length -ne $item.Length -or $entry.LastWriteUtc -ne $ticks) {
+            $entry = @{
+                Hash = (Get-FileHash -LiteralPath $item.FullName -Algorithm SHA256).Hash
+                Length = $item.Length
+                LastWriteUtc = $ticks
+            }
+            $dirty = $true
+        }
+        $files[$relative] = $entry
+    }
+
+    if ($dirty -or $files.Count -ne $cached.Count) {
+        try {
+            @{ Source = $SourcePath; Version = $version; Files = $files } |
+                ConvertTo-Json -Depth 4 -Compress |
+                Set-Content -LiteralPath $CacheFile -Encoding utf8
+        }
+        catch {
+            Write-Verbose "No se pudo guardar la cache de manifiesto: $_"
+        }
+    }
+
+    return $files
+}
+
+function script:Get-TemplateDigest {
+    # Identificador del contenido completo de la plantilla (nombre del almacen compartido)
+    param(
+        [Parameter(Mandatory)]
+        [hashtable]$Manifest
+    )
+
+    $lines = foreach ($relative in $Manifest.Keys | Sort-Object) {
+        "${relative}:$($Manifest[$relative].Hash)"
+    }
+    $bytes = [System.Text.Encoding]::UTF8.GetBytes(($lines -join "`n"))
+    $sha = [System.Security.Cryptography.SHA256]::Create()
+    try {
+        $hash = $sha.ComputeHash($bytes)
+    }
+    finally {
+        $sha.Dispose()
+    }
+    return ([System.BitConverter]::ToString($hash) -replace '-', '').Substring(0, 16).ToLowerInvariant()
+}
+
+function script:Read-TemplateBundleIndex {
+    param(
+        [Parameter(Mandatory)]
+        [string]$Path
+    )
+
+    Add-Type -AssemblyName System.IO.Compression.ZipFile
+    $zip = [System.IO.Compression.ZipFile]::OpenRead($Path)
+    try {
+        $entry = $zip.GetEntry($script:BundleIndexName)
+        if (-not $entry) {
+            throw "El paquete $Path no contiene $script:BundleIndexName"
+        }
+        $reader = [System.IO.StreamReader]::new($entry.Open())
+        try {
+            $index = $reader.ReadToEnd() | ConvertFrom-Json -AsHashtable
+        }
+        finally {
+            $reader.Dispose()
+        }
+    }
+    finally {
+        $zip.Dispose()
+    }
+
+    return $index.Files
+}
+
+function script:Get-TemplateStore {
+    <#
+    .SYNOPSIS
+    Devuelve la carpeta del almacen compartido con el contenido de la plantilla.
+
+    .DESCRIPTION
+    El almacen vive en la cache del usuario, se nombra por el digest del
+    manifiesto y se materializa una sola vez (desde el paquete si existe, o
+    desde templates/). Sus archivos quedan de solo lectura porque los
+    proyectos pueden enlazarlos.
+    #>
+    param(
+        [Parameter(Mandatory)]
+        [hashtable]$Manifest
+    )
+
+    $store = Join-Path (Get-M8bitsCachePath) "store" (Get-TemplateDigest -Manifest $Manifest)
+    if (Test-Path -LiteralPath (Join-Path $store $script:StoreMarkerName)) {
+        return $store
+    }
+
+    # Se prepara en una carpeta temporal y se mueve al final: otro proceso puede estar haciendo lo mismo
+    $staging = "$store.tmp-$PID-$([System.IO.Path]::GetRandomFileName())"
+    New-Item -ItemType Directory -Path $staging -Force | Out-Null
+
+    try {
+        $bundle = if ($script:TemplateManifest) { $script:TemplateManifest.Bundle } else { $null }
+        if ($bundle) {
+            Add-Type -AssemblyName System.IO.Compression.ZipFile
+            [System.IO.Compression.ZipFile]::ExtractToDirectory($bundle, $staging)
+            Remove-Item -LiteralPath (Join-Path $staging $script:BundleIndexName) -Force
+        }
+        else {
+            foreach ($relative in $Manifest.Keys) {
+                $destination = Join-Path $staging $relative
+                $parent = Split-Path $destination -Parent
+                if (-not (Test-Path -LiteralPath $parent)) {
+                    New-Item -ItemType Directory -Path $parent -Force | Out-Null
+                }
+                Copy-Item -LiteralPath (Join-Path $script:ClaudeCleanPath $relative) -Destination $destination -Force
+            }
+        }
+
+        foreach ($item in Get-ChildItem -LiteralPath $staging -Recurse -File -Force) {
+            $item.IsReadOnly = $true
+        }
+        New-Item -ItemType File -Path (Join-Path $staging $script:StoreMarkerName) | Out-Null
+
+        [System.IO.Directory]::Move($staging, $store)
+    }
+    catch {
+        if (-not (Test-Path -LiteralPath (Join-Path $store $script:StoreMarkerName))) {
+            throw
+        }
+    }
+    finally {
+        if (Test-Path -LiteralPath $staging) {
+            Remove-Item -LiteralPath $staging -Recurse -Force
+        }
+    }
+
+    return $store
+}
+
+function script:Test-SharedAsset {
+    param(
+        [Parameter(Mandatory)]
+        [string]$RelativePath
+    )
+
+    foreach ($prefix in $script:SharedAssetPaths) {
+        if ($RelativePath.StartsWith($prefix, [System.StringComparison]::OrdinalIgnoreCase)) {
+            return $true
+        }
+    }
+    return $false
+}
+
+function script:Get-TemplateStatCachePath {
+    # Cache de tamano/fecha -> hash de los archivos de un proyecto, en la cache
+    # del usuario: las fechas cambian en cada clon y no deben versionarse
+    param(
+        [Parameter(Mandatory)]
+        [string]$TargetPath
+    )
+
+    $bytes = [System.Text.Encoding]::UTF8.GetBytes($TargetPath)
+    $sha = [System.Security.Cryptography.SHA256]::Create()
+    try {
+        $hash = $sha.ComputeHash($bytes)
+    }
+    finally {
+        $sha.Dispose()
+    }
+    $key = ([System.BitConverter]::ToString($hash) -replace '-', '').Substring(0, 16).ToLowerInvariant()
+    return Join-Path (Get-M8bitsCachePath) "projects" "$key.json"
+}
+
+function script:Sync-ClaudeTemplate {
+    <#
+    .SYNOPSIS
+    Copia a TargetPath solo los archivos de la plantilla cuyo hash difiere.
+
+    .DESCRIPTION
+    Usa el registro .claude/.m8bits-state.json del proyecto para distinguir
+    archivos desactualizados (se copian) de archivos editados localmente (se
+    conservan salvo -Force). El registro solo guarda hashes, asi que no
+    cambia al clonar el proyecto; el tamano y la fecha de cada archivo, que
+    evitan rehashearlo, se guardan en la cache del usuario. Devuelve un objeto con las rutas relativas de
+    cada categoria: Added, Changed, Unchanged, Modified, Overwritten.
+
+    Con -LinkMode HardLink o SymbolicLink los recursos inmutables (hooks,
+    chat_viewer, docs) se enlazan desde el almacen compartido y solo se
+    copian los archivos propios del proyecto (settings.local.json, CLAUDE.md...).
+
+    Se puede pasar un -Manifest y un -SourcePath ya calculados para no
+    recalcularlos en cada proyecto (por ejemplo, desde los runspaces de bulk).
+    #>
+    [CmdletBinding()]
+    param(
+        [Parameter(Mandatory)]
+        [string]$TargetPath,
+
+        [switch]$Force,
+
+        [hashtable]$Manifest,
+
+        [string]$SourcePath,
+
+        [ValidateSet("Copy", "HardLink", "SymbolicLink")]
+        [string]$LinkMode = "Copy"
+    )
+
+    if (-not $Manifest) {
+        $Manifest = Get-TemplateManifest
+    }
+    if (-not $SourcePath) {
+        $bundle = $script:TemplateManifest -and $script:TemplateManifest.Bundle
+        $SourcePath = if ($bundle -or $LinkMode -ne "Copy") { Get-TemplateStore -Manifest $Manifest } else { $script:ClaudeCleanPath }
+    }
+    $TargetPath = $ExecutionContext.SessionState.Path.GetUnresolvedProviderPathFromPSPath($TargetPath)
+    $statePath = Join-Path $TargetPath ".claude" $script:StateFileName
+    $statCachePath = Get-TemplateStatCachePath -TargetPath $TargetPath
+
+    $state = @{}
+    if (Test-Path -LiteralPath $statePath) {
+        try {
+            $saved = Get-Content -LiteralPath $statePath -Raw | ConvertFrom-Json -AsHashtable
+            if ($saved.Files) {
+                $state = $saved.Files
+            }
+        }
+        catch {
+            Write-Verbose "Registro de despliegue invalido en ${statePath}: $_"
+        }
+    }
+
+    $stats = @{}
+    if (Test-Path -LiteralPath $statCachePath) {
+        try {
+            $saved = Get-Content -LiteralPath $statCachePath -Raw | ConvertFrom-Json -AsHashtable
+            if ($saved.Files) {
+                $stats = $saved.Files
+            }
+        }
+        catch {
+            Write-Verbose "Cache de fechas invalida en ${statCachePath}: $_"
+        }
+    }
+
+    $result = [ordered]@{ Path = "$TargetPath" }
+    foreach ($status in "Added", "Changed", "Unchanged", "Modified", "Overwritten", "Linked") {
+        $result[$status] = [System.Collections.Generic.List[string]]::new()
+    }
+
+    $newState = @{}
+    $stateChanged = $false
+    $newStats = @{}
+    $statsChanged = $false
+    foreach ($relative in $Manifest.Keys | Sort-Object) {
+        $source = $Manifest[$relative]
+        $link = $LinkMode -ne "Copy" -and (Test-SharedAsset -RelativePath $relative)
+        $recorded = $state[$relative]
+        $destination = Join-Path $TargetPath $relative
+
+        $status = "Added"
+        if (Test-Path -LiteralPath $destination -PathType Leaf) {
+            $current = Get-Item -LiteralPath $destination -Force
+
+            # Si tamano y fecha coinciden con la cache, el hash guardado sigue valido
+            $stat = $stats[$relative]
+            if ($stat -and $stat.Length -eq $current.Length -and $stat.LastWriteUtc -eq $current.LastWriteTimeUtc.Ticks) {
+                $currentHash = $stat.Hash
+            }
+            else {
+                $currentHash = (Get-FileHash -LiteralPath $destination -Algorithm SHA256).Hash
+                $statsChanged = $true
+            }
+            $newStats[$relative] = @{ Hash = $currentHash; Length = $current.Length; LastWriteUtc = $current.LastWriteTimeUtc.Ticks }
+
+            if ($currentHash -eq $source.Hash) {
+                $status = "Unchanged"
+
+                # Una copia identica se convierte en enlace si se pidio
+                if ($link -and $current.LinkType -ne $LinkMode) {
+                    $status = "Relink"
+                }
+            }
+            elseif ($recorded -and $currentHash -eq $recorded.Hash) {
+                $status = "Changed"
+            }
+            elseif ($Force) {
+                $status = "Overwritten"
+            }
+            else {
+                $status = "Modified"
+            }
+        }
+
+        switch ($status) {
+            "Unchanged" {
+                # Solo cuenta el hash: una fecha distinta (otro clon) no reescribe el registro
+                if (-not $recorded -or $recorded.Hash -ne $source.Hash) {
+                    $stateChanged = $true
+                }
+                $newState[$relative] = @{ Hash = $source.Hash }
+            }
+            "Modified" {
+                # Se conserva la version registrada para detectar futuras actualizaciones
+                if ($recorded) {
+                    $newState[$relative] = $recorded
+                }
+            }
+            default {
+                $parent = Split-Path $destination -Parent
+                if (-not (Test-Path -LiteralPath $parent)) {
+                    New-Item -ItemType Directory -Path $parent -Force | Out-Null
+                }
+
+                # Nunca se escribe encima: el destino puede ser un enlace al almacen compartido
+                # Get-Item tambien encuentra enlaces simbolicos rotos (almacen borrado)
+                if (Get-Item -LiteralPath $destination -Force -ErrorAction SilentlyContinue) {
+                    Remove-Item -LiteralPath $destination -Force
+                }
+
+                $sourceFile = Join-Path $SourcePath $relative
+                $linked = $false
+                if ($link) {
+                    try {
+                        New-Item -ItemType $LinkMode -Path $destination -Target $sourceFile -ErrorAction Stop | Out-Null
+                        $linked = $true
+                    }
+                    catch {
+                        # Otro volumen o sin permisos para symlinks: se copia
+                        Write-Verbose "No se pudo enlazar ${relative}, se copia: $_"
+                    }
+                }
+                if (-not $linked) {
+                    Copy-Item -LiteralPath $sourceFile -Destination $destination -Force
+                }
+
+                $copied = Get-Item -LiteralPath $destination -Force
+                if (-not $linked -and $copied.IsReadOnly) {
+                    $copied.IsReadOnly = $false
+                }
+                $newState[$relative] = @{ Hash = $source.Hash }
+                $newStats[$relative] = @{ Hash = $source.Hash; Length = $copied.Length; LastWriteUtc = $copied.LastWriteTimeUtc.Ticks }
+                $stateChanged = $true
+                $statsChanged = $true
+                if ($linked) {
+                    $result.Linked.Add($relative)
+                }
+            }
+        }
+
+        if ($status -eq "Relink") {
+            $status = "Unchanged"
+        }
+        $result[$status].Add($relative)
+    }
+
+    # Solo se reescribe el registro si algo cambio, para no tocar fechas en vano
+    if ($stateChanged -or $newState.Count -ne $state.Count) {
+        $stateFolder = Split-Path $statePath -Parent
+        if (-not (Test-Path -LiteralPath $stateFolder)) {
+            New-Item -ItemType Directory -Path $stateFolder -Force | Out-Null
+        }
+        @{ Version = "$($MyInvocation.MyCommand.Module.Version)"; Files = $newState } |
+            ConvertTo-Json -Depth 4 |
+            Set-Content -LiteralPath $statePath -Encoding utf8
+    }
+
+    if ($statsChanged -or $newStats.Count -ne $stats.Count) {
+        try {
+            $statFolder = Split-Path $statCachePath -Parent
+            if (-not (Test-Path -LiteralPath $statFolder)) {
+                New-Item -ItemType Directory -Path $statFolder -Force | Out-Null
+            }
+            @{ Path = $TargetPath; Files = $newStats } |
+                ConvertTo-Json -Depth 4 -Compress |
+                Set-Content -LiteralPath $statCachePath -Encoding utf8
+        }
+        catch {
+            Write-Verbose "No se pudo guardar la cache de fechas: $_"
+        }
+    }
+
+    return [PSCustomObject]$result
+}
+
+function script:Write-TemplateSyncReport {
+    param(
+        [Parameter(Mandatory)]
+        $Result
+    )
+
+    $copied = $Result.Added.Count + $Result.Changed.Count + $Result.Overwritten.Count
+    $color = if ($Result.Modified.Count) { "Yellow" } else { "Green" }
+    Write-Host "[OK] Configuracion .claude sincronizada ($copied archivos copiados)." -ForegroundColor $color
+    Write-Host "     Nuevos: $($Result.Added.Count)  Actualizados: $($Result.Changed.Count)  Sin cambios: $($Result.Unchanged.Count)  Modificados localmente: $($Result.Modified.Count)  Sobrescritos: $($Result.Overwritten.Count)" -ForegroundColor Gray
+    if ($Result.Linked.Count) {
+        Write-Host "     Enlazados desde el almacen compartido: $($Result.Linked.Count)" -ForegroundColor Gray
+    }
+
+    foreach ($relative in $Result.Modified) {
+        Write-Host "  [!] Se conserva la version local: $relative" -ForegroundColor Yellow
+    }
+    if ($Result.Modified.Count) {
+        Write-Host "     Usa 'm8bits sync -Force' para reemplazarlos por la plantilla." -ForegroundColor Cyan
+    }
+}
@@ -0,0 +1,225 @@
+# Pruebas de m8bits (Pester 5): Invoke-Pester ./tests
+
+BeforeAll {
+    Import-Module (Join-Path $PSScriptRoot ".." "m8bits.psd1") -Force
+
+    # Subcomandos de prueba registrados en el modulo: uno con ShouldProcess y otro sin el
+    InModuleScope m8bits {
+        function script:Test-M8bitsTarget {
+            [CmdletBinding(SupportsShouldProcess)]
+            param(
+                [string]$Path,
+
+                [string]$Query,
+
+                [ValidateRange(1, 5)]
+                [int]$Count,
+
+                [switch]$Flag
+            )
+
+            [PSCustomObject]@{ Bound = [hashtable]::new($PSBoundParameters); WhatIf = [bool]$WhatIfPreference }
+        }
+
+        function script:Test-M8bitsPlainTarget {
+            [CmdletBinding()]
+            param(
+                [string]$Path
+            )
+
+            [PSCustomObject]@{ Bound = [hashtable]::new($PSBoundParameters) }
+        }
+
+        $script:M8bitsCommands["ztest"] = @{
+            File = $null
+            Function = "Test-M8bitsTarget"
+            Description = "Prueba"
+            Arguments = @("Path", "Query")
+            Text = @("Query")
+        }
+        $script:M8bitsCommands["zplain"] = @{
+            File = $null
+            Function = "Test-M8bitsPlainTarget"
+            Description = "Prueba sin ShouldProcess"
+            Arguments = @("Path")
+        }
+    }
+}
+
+AfterAll {
+    Remove-Module m8bits -Force -ErrorAction SilentlyContinue
+}
+
+Describe "Invoke-M8bits" {
+    It "asigna los posicionales a los parametros del registro" {
+        $result = Invoke-M8bits ztest "proyecto" "texto"
+
+        $result.Bound.Path | Should -Be "proyecto"
+        $result.Bound.Query | Should -Be "texto"
+    }
+
+    It "usa el primer elemento si el parametro no es un array" {
+        $result = Invoke-M8bits ztest a, b
+
+        $result.Bound.Path | Should -Be "a"
+    }
+
+    It "reenvia los parametros con nombre y los switches del subcomando" {
+        $result = Invoke-M8bits ztest -Count 3 -Flag
+
+        $result.Bound.Count | Should -Be 3
+        $result.Bound.Flag.IsPresent | Should -BeTrue
+    }
+
+    It "aplica la validacion del parametro original" {
+        { Invoke-M8bits ztest -Count 9 } | Should -Throw
+    }
+
+    It "rechaza un parametro que el subcomando no declara" {
+        { Invoke-M8bits ztest -Bogus } | Should -Throw "*Parametro desconocido*"
+    }
+
+    It "acepta texto libre que empieza por '-'" {
+        $result = Invoke-M8bits ztest "proyecto" "-rf"
+
+        $result.Bound.Query | Should -Be "-rf"
+    }
+
+    It "rechaza argumentos de mas" {
+        { Invoke-M8bits ztest "a" "b" "c" } | Should -Throw "*Demasiados argumentos*"
+    }
+
+    It "reenvia -WhatIf a los subcomandos que lo admiten" {
+        $result = Invoke-M8bits ztest -WhatIf
+
+        $result.WhatIf | Should -BeTrue
+    }
+
+    It "rechaza -WhatIf y -Confirm en los subcomandos que no los admiten" {
+        { Invoke-M8bits zplain -WhatIf } | Should -Throw "*no admite -WhatIf*"
+        { Invoke-M8bits zplain -Confirm } | Should -Throw "*no admite -Confirm*"
+    }
+}
+
+Describe "Sync-ClaudeTemplate" {
+    BeforeEach {
+        $source = Join-Path $TestDrive "templates-$([guid]::NewGuid())"
+        $project = Join-Path $TestDrive "project-$([guid]::NewGuid())"
+        New-Item -ItemType Directory -Path (Join-Path $source ".claude" "logs_system" "hooks") -Force | Out-Null
+        New-Item -ItemType Directory -Path $project -Force | Out-Null
+        Set-Content -LiteralPath (Join-Path $source ".claude" "CLAUDE.md") -Value "plantilla v1"
+        Set-Content -LiteralPath (Join-Path $source ".claude" "settings.local.json") -Value "{}"
+        Set-Content -LiteralPath (Join-Path $source ".claude" "logs_system" "hooks" "hook.ps1") -Value "# hook"
+
+        # La cache del usuario (manifiesto y fechas) va a TestDrive
+        Mock -ModuleName m8bits Get-M8bitsCachePath { (Get-PSDrive TestDrive).Root }
+
+        $sync = {
+            param([switch]$Force, [string]$LinkMode = "Copy")
+            $parameters = @{ Source = $source; Project = $project; CacheFile = "$source.manifest.json"; Force = $Force; LinkMode = $LinkMode }
+            InModuleScope m8bits -Parameters $parameters {
+                param($Source, $Project, $CacheFile, $Force, $LinkMode)
+                Import-M8bitsLibrary -Name templates
+                $manifest = Get-TemplateFolderManifest -SourcePath $Source -CacheFile $CacheFile
+                Sync-ClaudeTemplate -TargetPath $Project -Manifest $manifest -SourcePath $Source -Force:$Force -LinkMode $LinkMode
+            }
+        }
+    }
+
+    It "copia todo en el primer despliegue y nada en el segundo" {
+        $first = & $sync
+        $first.Added.Count | Should -Be 3
+
+        $statePath = Join-Path $project ".claude" ".m8bits-state.json"
+        $stateTime = (Get-Item -LiteralPath $statePath).LastWriteTimeUtc
+
+        $second = & $sync
+        $second.Unchanged.Count | Should -Be 3
+        $second.Added.Count + $second.Changed.Count | Should -Be 0
+        (Get-Item -LiteralPath $statePath).LastWriteTimeUtc | Should -Be $stateTime
+    }
+
+    It "solo guarda hashes en el registro del proyecto" {
+        & $sync | Out-Null
+
+        $state = Get-Content -LiteralPath (Join-Path $project ".claude" ".m8bits-state.json") -Raw | ConvertFrom-Json -AsHashtable
+        $state.Files[".claude/CLAUDE.md"].Keys | Should -Be @("Hash")
+    }
+
+    It "actualiza los archivos que cambiaron en la plantilla" {
+        & $sync | Out-Null
+        Set-Content -LiteralPath (Join-Path $source ".claude" "CLAUDE.md") -Value "plantilla v2 con mas texto"
+
+        $result = & $sync
+
+        $result.Changed | Should -Be @(".claude/CLAUDE.md")
+        Get-Content -LiteralPath (Join-Path $project ".claude" "CLAUDE.md") | Should -Be "plantilla v2 con mas texto"
+    }
+
+    It "conserva las ediciones locales salvo con -Force" {
+        & $sync | Out-Null
+        Set-Content -LiteralPath (Join-Path $project ".claude" "CLAUDE.md") -Value "edicion local del proyecto"
+        Set-Content -LiteralPath (Join-Path $source ".claude" "CLAUDE.md") -Value "plantilla v2 con mas texto"
+
+        $kept = & $sync
+        $kept.Modified | Should -Be @(".claude/CLAUDE.md")
+        Get-Content -LiteralPath (Join-Path $project ".claude" "CLAUDE.md") | Should -Be "edicion local del proyecto"
+
+        $forced = & $sync -Force
+        $forced.Overwritten | Should -Be @(".claude/CLAUDE.md")
+        Get-Content -LiteralPath (Join-Path $project ".claude" "CLAUDE.md") | Should -Be "plantilla v2 con mas texto"
+    }
+
+    It "convierte en enlace una copia identica de un recurso compartido" {
+        & $sync | Out-Null
+
+        $result = & $sync -LinkMode HardLink
+
+        $result.Linked | Should -Be @(".claude/logs_system/hooks/hook.ps1")
+        $result.Unchanged.Count | Should -Be 3
+        (Get-Item -LiteralPath (Join-Path $project ".claude" "logs_system" "hooks" "hook.ps1")).LinkType | Should -Be "HardLink"
+    }
+}
+
+Describe "Compresion de logs" {
+    BeforeEach {
+        $logs = Join-Path $TestDrive "project-$([guid]::NewGuid())" ".claude" "logs_system" "logs"
+        New-Item -ItemType Directory -Path $logs -Force | Out-Null
+        $log = Join-Path $logs "session.jsonl"
+    }
+
+    It "agrega un miembro gzip si el archivo comprimido ya existe" {
+        InModuleScope m8bits -Parameters @{ Log = $log } {
+            param($Log)
+            Import-M8bitsCommand -Name logs
+
+            Set-Content -LiteralPath $Log -Value "linea A"
+            Compress-LogFile -File (Get-Item -LiteralPath $Log)
+            Set-Content -LiteralPath $Log -Value "linea B"
+            Compress-LogFile -File (Get-Item -LiteralPath $Log)
+
+            $lines = Select-ArchivedLogLine -Path "$Log.gz" -Matcher ([regex]"linea")
+            $lines.Line | Should -Be @("linea A", "linea B")
+            Test-Path -LiteralPath $Log | Should -BeFalse
+            Test-Path -LiteralPath "$Log.gz.tmp" | Should -BeFalse
+        }
+    }
+
+    It "no modifica nada con -WhatIf" {
+        InModuleScope m8bits -Parameters @{ Log = $log } {
+            param($Log)
+            Import-M8bitsCommand -Name logs
+
+            Set-Content -LiteralPath $Log -Value ("linea repetida`n" * 1000)
+            (Get-Item -LiteralPath $Log).LastWriteTimeUtc = [DateTime]::UtcNow.AddDays(-30)
+            $project = Split-Path (Split-Path (Split-Path (Split-Path $Log -Parent) -Parent) -Parent) -Parent
+
+            $row = Compress-ClaudeLog -Path $project -WhatIf
+
+            $row.Compressed | Should -Be 1
+            $row.BytesAfter | Should -BeLessThan $row.BytesBefore
+            Test-Path -LiteralPath $Log | Should -BeTrue
+            Test-Path -LiteralPath "$Log.gz" | Should -BeFalse
+        }
+    }
+}
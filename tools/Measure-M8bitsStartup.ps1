@@ -0,0 +1,82 @@
+<#
+.SYNOPSIS
+Mide el tiempo de importacion del modulo y la latencia de 'm8bits help'.
+
+.DESCRIPTION
+Cada iteracion lanza un pwsh nuevo (-NoProfile) que importa el modulo y
+ejecuta 'm8bits help', midiendo cada fase con un Stopwatch dentro del
+proceso hijo para no contar el arranque del interprete. Muestra la
+mediana y el p95 de cada fase y termina con codigo 1 si la mediana de
+import + help supera -BudgetMs (util en CI).
+
+.PARAMETER Iterations
+Numero de procesos a lanzar.
+
+.PARAMETER BudgetMs
+Presupuesto en milisegundos para import + help.
+
+.EXAMPLE
+./tools/Measure-M8bitsStartup.ps1 -Iterations 20 -BudgetMs 150
+#>
+[CmdletBinding()]
+param(
+    [ValidateRange(1, 1000)]
+    [int]$Iterations = 10,
+
+    [double]$BudgetMs = 200
+)
+
+$manifestPath = (Resolve-Path (Join-Path $PSScriptRoot ".." "m8bits.psd1")).Path
+$pwsh = (Get-Process -Id $PID).Path
+
+$probe = @"
+`$sw = [System.Diagnostics.Stopwatch]::StartNew()
+Import-Module '$manifestPath'
+`$import = `$sw.Elapsed.TotalMilliseconds
+`$sw.Restart()
+m8bits help 6>`$null
+`$help = `$sw.Elapsed.TotalMilliseconds
+"`$import;`$help"
+"@
+
+function Get-Percentile {
+    param(
+        [double[]]$Values,
+        [double]$Percent
+    )
+
+    $sorted = $Values | Sort-Object
+    $index = [math]::Ceiling($Percent / 100 * $sorted.Count) - 1
+    return $sorted[[math]::Max(0, $index)]
+}
+
+$imports = [System.Collections.Generic.List[double]]::new()
+$helps = [System.Collections.Generic.List[double]]::new()
+for ($i = 0; $i -lt $Iterations; $i++) {
+    $output = & $pwsh -NoProfile -NonInteractive -Command $probe
+    $parts = "$output".Trim() -split ";"
+    $imports.Add([double]::Parse($parts[0], [cultureinfo]::InvariantCulture))
+    $helps.Add([double]::Parse($parts[1], [cultureinfo]::InvariantCulture))
+}
+
+$totals = for ($i = 0; $i -lt $Iterations; $i++) { $imports[$i] + $helps[$i] }
+$rows = foreach ($phase in @(
+        @{ Name = "Import-Module"; Values = $imports.ToArray() },
+        @{ Name = "m8bits help"; Values = $helps.ToArray() },
+        @{ Name = "Total"; Values = [double[]]$totals }
+    )) {
+    [PSCustomObject]@{
+        Fase = $phase.Name
+        MedianaMs = [math]::Round((Get-Percentile -Values $phase.Values -Percent 50), 1)
+        P95Ms = [math]::Round((Get-Percentile -Values $phase.Values -Percent 95), 1)
+    }
+}
+
+$rows | Format-Table -AutoSize | Out-Host
+
+$median = Get-Percentile -Values $totals -Percent 50
+if ($median -gt $BudgetMs) {
+    Write-Host ("[X] Arranque fuera de presupuesto: {0:N1} ms > {1:N1} ms" -f $median, $BudgetMs) -ForegroundColor Red
+    exit 1
+}
+Write-Host ("[OK] Arranque dentro de presupuesto: {0:N1} ms <= {1:N1} ms ({2} iteraciones)" -f $median, $BudgetMs, $Iterations) -ForegroundColor Green